@@ -1,43 +1,47 @@
-
-"""Command implementations for Solo Git CLI."""
-
-import asyncio
-import click
-from pathlib import Path
-from typing import List, Optional
 """Command implementations for the Solo Git CLI."""
 
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+import posixpath
+import re
 import time
+from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, List, NoReturn, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, NoReturn, Optional, Sequence, Tuple, Union, cast
 
 import click
 from rich.console import Console
+from rich.text import Text
 
+from sologit.config.manager import ConfigManager
 from sologit.core.repository import Repository
 from sologit.core.workpad import Workpad
 from sologit.engines.git_engine import GitEngine, GitEngineError
 from sologit.engines.patch_engine import PatchEngine
-from sologit.engines.test_orchestrator import TestConfig, TestOrchestrator, TestStatus
+from sologit.engines.test_orchestrator import TestConfig, TestOrchestrator, TestResult, TestStatus
 from sologit.state.git_sync import GitStateSync
 from sologit.state.manager import StateManager
-from sologit.utils.logger import get_logger
 from sologit.state.schema import TestResult as StateTestResult
 from sologit.ui.formatter import RichFormatter
 from sologit.ui.theme import theme
 from sologit.utils.logger import get_logger
-from sologit.workflows.ci_orchestrator import CIOrchestrator
-from sologit.workflows.rollback_handler import RollbackHandler
+
+if TYPE_CHECKING:
+    # Importing any workflow module loads the whole ``sologit.workflows``
+    # package, so the CI/rollback classes are imported where they are used.
+    from sologit.workflows.ci_orchestrator import CIOrchestrator
+    from sologit.workflows.rollback_handler import RollbackHandler
 
 logger = get_logger(__name__)
 
 formatter = RichFormatter()
 
+_WS_RE = re.compile(r"\s+")
+
 
+_config_manager: Optional[ConfigManager] = None
 _git_engine: Optional[GitEngine] = None
 _patch_engine: Optional[PatchEngine] = None
 _test_orchestrator: Optional[TestOrchestrator] = None
@@ -46,15 +50,6 @@ _ci_orchestrator: Optional[CIOrchestrator] = None
 _rollback_handler: Optional[RollbackHandler] = None
 
 
-_STATUS_ICONS = {
-    TestStatus.PASSED: "✅",
-    TestStatus.FAILED: "❌",
-    TestStatus.TIMEOUT: "⏳",
-    TestStatus.ERROR: "❌",
-    TestStatus.SKIPPED: "⚪",
-}
-
-
 def set_formatter_console(console: Console) -> None:
     """Allow the CLI to reuse an externally managed Rich console."""
 
@@ -70,8 +65,6 @@ def abort_with_error(
     tip: Optional[str] = None,
     suggestions: Optional[Iterable[str]] = None,
     docs_url: Optional[str] = None,
-) -> None:
-    """Render a contextual error panel and abort the active command."""
 ) -> NoReturn:
     """Display a formatted error with rich context and abort the command."""
 
@@ -90,12 +83,6 @@ def abort_with_error(
     raise click.Abort()
 
 
-_git_engine: Optional[GitEngine] = None
-_patch_engine: Optional[PatchEngine] = None
-_test_orchestrator: Optional[TestOrchestrator] = None
-_git_state_sync: Optional[GitStateSync] = None
-
-
 def get_config_manager() -> ConfigManager:
     """Get or create ConfigManager instance."""
 
@@ -182,8 +169,6 @@ def _parse_test_override(value: str, default_timeout: int) -> TestConfig:
         raise click.BadParameter("Command cannot be empty")
 
     return TestConfig(name=name, cmd=cmd, timeout=timeout)
-_ci_orchestrator: Optional[CIOrchestrator] = None
-_rollback_handler: Optional[RollbackHandler] = None
 
 
 def get_git_engine() -> GitEngine:
@@ -209,7 +194,6 @@ def get_test_orchestrator() -> TestOrchestrator:
 
     global _test_orchestrator
     if _test_orchestrator is None:
-        _test_orchestrator = TestOrchestrator(get_git_engine(), formatter=formatter)
         config = get_config_manager().config.tests
         log_dir = Path(config.log_dir).expanduser() if config.log_dir is not None else None
         _test_orchestrator = TestOrchestrator(
@@ -236,7 +220,9 @@ def get_ci_orchestrator() -> CIOrchestrator:
 
     global _ci_orchestrator
     if _ci_orchestrator is None:
-        _ci_orchestrator = CIOrchestrator(get_git_engine(), formatter=formatter)
+        from sologit.workflows.ci_orchestrator import CIOrchestrator
+
+        _ci_orchestrator = CIOrchestrator(get_git_engine(), get_test_orchestrator())
     return _ci_orchestrator
 
 
@@ -245,7 +231,9 @@ def get_rollback_handler() -> RollbackHandler:
 
     global _rollback_handler
     if _rollback_handler is None:
-        _rollback_handler = RollbackHandler(get_git_engine(), formatter=formatter)
+        from sologit.workflows.rollback_handler import RollbackHandler
+
+        _rollback_handler = RollbackHandler(get_git_engine())
     return _rollback_handler
 
 
@@ -265,6 +253,43 @@ def _require_workpad(workpad: Optional[Workpad], pad_id: str) -> Workpad:
     return workpad
 
 
+# Shared, pre-styled badges reused across table rows instead of re-parsing markup per row.
+_TEST_RESULT_BADGES: Dict[TestStatus, Text] = {
+    TestStatus.PASSED: Text("✅ passed"),
+    TestStatus.FAILED: Text("❌ failed"),
+    TestStatus.TIMEOUT: Text("⏱️ timeout"),
+    TestStatus.ERROR: Text("⚠️ error"),
+    TestStatus.SKIPPED: Text("⏭️ skipped"),
+}
+_WORKPAD_TEST_BADGES: Dict[str, Text] = {
+    "passed": Text("✅ passed"),
+    "failed": Text("❌ failed"),
+}
+_PENDING_TEST_BADGE = Text("⏳ pending")
+_NO_TEST_BADGE = Text("-")
+
+
+def _build_status_badge(status: str) -> Text:
+    """Render the coloured icon + label badge for a workpad status."""
+
+    color = theme.get_status_color(status)
+    return Text.from_markup(f"[{color}]{theme.get_status_icon(status)} {status}[/{color}]")
+
+
+_STATUS_BADGES: Dict[str, Text] = {
+    status: _build_status_badge(status) for status in ("active", "pending", "promoted", "deleted")
+}
+
+
+def _status_badge(status: str) -> Text:
+    """Return the shared badge for a workpad status, building unknown ones once."""
+
+    badge = _STATUS_BADGES.get(status)
+    if badge is None:
+        badge = _STATUS_BADGES[status] = _build_status_badge(status)
+    return badge
+
+
 def _format_datetime(value: object) -> str:
     """Format a datetime-like object for output."""
 
@@ -273,17 +298,42 @@ def _format_datetime(value: object) -> str:
     return str(value)
 
 
-def _build_test_configs(target: str) -> List[TestConfig]:
-    """Return default test configurations for the requested target."""
+# Repository is a dataclass, so every listed field is always present.
+_REPO_ROW_FIELDS = attrgetter("id", "name", "trunk_branch", "workpad_count", "created_at")
 
-    if target == "full":
-        return [
-            TestConfig(name="lint", cmd="make lint", timeout=600),
-            TestConfig(name="integration", cmd="pytest", timeout=1800),
-        ]
-    return [
-        TestConfig(name="unit-tests", cmd="pytest -m fast", timeout=900),
-    ]
+
+def _format_minute(value: datetime) -> str:
+    """Format a known datetime to minute precision."""
+
+    return value.strftime("%Y-%m-%d %H:%M")
+
+
+def _created_formatter(items: Sequence[Any]) -> Callable[[Any], str]:
+    """Pick the ``created_at`` formatter for a list once, based on its first row.
+
+    Listings come from a single backend, so every row shares the same type.
+    """
+
+    if items and isinstance(getattr(items[0], "created_at", None), datetime):
+        return _format_minute
+    return _format_datetime
+
+
+_DEFAULT_FAST_TESTS: Tuple[TestConfig, ...] = (
+    TestConfig(name="unit-tests", cmd="python -m pytest tests/ -q", timeout=60),
+)
+_DEFAULT_FULL_TESTS: Tuple[TestConfig, ...] = _DEFAULT_FAST_TESTS + (
+    TestConfig(name="integration", cmd="python -m pytest tests/integration/ -q", timeout=120),
+)
+
+
+def _default_tests(target: str) -> Sequence[TestConfig]:
+    """Return the default set of tests for the given target.
+
+    The returned configs are shared module constants and must not be mutated.
+    """
+
+    return _DEFAULT_FAST_TESTS if target == "fast" else _DEFAULT_FULL_TESTS
 
 
 @click.group()
@@ -291,13 +341,6 @@ def repo() -> None:
     """Repository management commands."""
 
 
-@repo.command('init')
-@click.option('--zip', 'zip_file', type=click.Path(exists=True), help='Initialize from zip file')
-@click.option('--git', 'git_url', type=str, help='Initialize from Git URL')
-@click.option('--empty', is_flag=True, help='Initialize an empty repository managed by Solo Git')
-@click.option('--path', 'target_path', type=click.Path(path_type=Path), help='Directory for empty repository (defaults to Solo Git data dir)')
-@click.option('--name', type=str, help='Repository name (optional)')
-def repo_init(zip_file: Optional[str], git_url: Optional[str], empty: bool, target_path: Optional[Path], name: Optional[str]):
 @repo.command("init")
 @click.option("--zip", "zip_file", type=click.Path(exists=True, path_type=Path), help="Initialize from zip file")
 @click.option("--git", "git_url", type=str, help="Initialize from Git URL")
@@ -317,27 +360,17 @@ def repo_init(
     name: Optional[str],
 ) -> None:
     """Initialize a repository from a zip archive, Git URL, or create an empty repo."""
-    """Initialize a new repository from zip file, Git URL, or empty."""
 
     formatter.print_header("Repository Initialization")
 
-    sources = {
-        "zip": bool(zip_file),
-        "git": bool(git_url),
-        "empty": bool(empty),
-    }
-    selected = [key for key, value in sources.items() if value]
-
-    if len(selected) != 1:
-        abort_with_error(
-            "Invalid Source Specification",
-            f"Please specify exactly one of --zip, --git, or --empty. Provided: {', '.join(selected) or 'None'}",
-    provided_sources = [label for label, enabled in sources.items() if enabled]
-
-    if len(provided_sources) != 1:
+    if bool(zip_file) + bool(git_url) + bool(empty) != 1:
+        provided_sources = [
+            label for label, enabled in (("zip", zip_file), ("git", git_url), ("empty", empty)) if enabled
+        ]
         abort_with_error(
             "Invalid Source Specification",
-            "Please specify exactly one of --zip, --git, or --empty.",
+            "Please specify exactly one of --zip, --git, or --empty. "
+            f"Provided: {', '.join(provided_sources) or 'None'}",
             title="Repository Initialization Blocked",
             help_text="Choose one initialization method to continue.",
             suggestions=[
@@ -357,7 +390,7 @@ def repo_init(
             formatter.print_info(f"Initializing from zip: {zip_file.name}")
             repo_info = git_sync.init_repo_from_zip(zip_file.read_bytes(), repo_name)
         elif git_url:
-            repo_name = name or Path(git_url.rstrip("/")).stem.replace(".git", "")
+            repo_name = name or posixpath.basename(git_url.rstrip("/")).removesuffix(".git")
             formatter.print_info(f"Cloning from: {git_url}")
             repo_info = git_sync.init_repo_from_git(git_url, repo_name)
         else:
@@ -366,41 +399,6 @@ def repo_init(
             repo_info = git_sync.create_empty_repo(
                 repo_name, str(target_path) if target_path else None
             )
-
-        formatter.print_success("Repository initialized!")
-        summary = formatter.table(headers=["Field", "Value"])
-        summary.add_row("ID", f"[cyan]{repo_info['repo_id']}[/cyan]")
-        summary.add_row("Name", f"[bold]{repo_info['name']}[/bold]")
-        summary.add_row("Path", repo_info.get("path", "-"))
-        summary.add_row(
-            "Trunk",
-            f"[cyan]{repo_info.get('trunk_branch', 'main')}[/cyan]",
-        )
-        formatter.console.print(summary)
-
-            base = git_url.rstrip("/").split("/")[-1]
-            if base.endswith(".git"):
-                base = base[:-4]
-            repo_name = name or base
-            formatter.print_info(f"Cloning from: {git_url}")
-            repo_info = git_sync.init_repo_from_git(git_url, repo_name)
-        else:
-            assert git_url is not None
-            repo_name = name or Path(git_url.rstrip("/")).stem
-            formatter.print_info(f"Cloning repository from: {git_url}")
-            repo_id = git_engine.init_from_git(git_url, repo_name)
-
-        repo_obj = _require_repository(git_engine.get_repo(repo_id), repo_id)
-
-        formatter.print_success("Repository initialized!")
-        formatter.print_info(f"Repo ID: {repo_info['repo_id']}")
-        formatter.print_info(f"Name: {repo_info['name']}")
-        formatter.print_info(f"Path: {repo_info['path']}")
-        formatter.print_info(f"Trunk: {repo_info.get('trunk_branch', 'main')}")
-        else:
-            repo_name = name or (target_path.name if target_path else "solo-git-repo")
-            formatter.print_info(f"Creating empty repository: {repo_name}")
-            repo_info = git_sync.create_empty_repo(repo_name, str(target_path) if target_path else None)
     except GitEngineError as exc:
         abort_with_error(
             "Repository initialization failed",
@@ -414,8 +412,8 @@ def repo_init(
     summary = formatter.table(headers=["Field", "Value"])
     summary.add_row("ID", f"[cyan]{repo_info['repo_id']}[/cyan]")
     summary.add_row("Name", f"[bold]{repo_info['name']}[/bold]")
-    summary.add_row("Path", repo_info['path'])
-    summary.add_row("Trunk", repo_info.get('trunk_branch', 'main'))
+    summary.add_row("Path", repo_info.get("path", "-"))
+    summary.add_row("Trunk", f"[cyan]{repo_info.get('trunk_branch', 'main')}[/cyan]")
     formatter.console.print(summary)
 
 
@@ -434,18 +432,14 @@ def repo_list() -> None:
     formatter.print_header(f"Repositories ({len(repos)})")
     table = formatter.table(headers=["ID", "Name", "Trunk", "Workpads", "Created"])
 
-    for repo_obj in repos:
+    format_created = _created_formatter(repos)
+    for repo_id, name, trunk, workpad_count, created in map(_REPO_ROW_FIELDS, repos):
         table.add_row(
-            f"[cyan]{repo.id}[/cyan]",
-            f"[bold]{repo.name}[/bold]",
-            repo.trunk_branch,
-            str(repo.workpad_count),
-            repo.created_at.strftime('%Y-%m-%d %H:%M')
-            f"[cyan]{repo_obj.id}[/cyan]",
-            f"[bold]{getattr(repo_obj, 'name', repo_obj.id)}[/bold]",
-            getattr(repo_obj, 'trunk_branch', 'main'),
-            str(getattr(repo_obj, 'workpad_count', 0)),
-            _format_datetime(getattr(repo_obj, 'created_at', '')),
+            f"[cyan]{repo_id}[/cyan]",
+            f"[bold]{name}[/bold]",
+            trunk,
+            str(workpad_count),
+            format_created(created),
         )
 
     formatter.console.print(table)
@@ -460,11 +454,11 @@ def repo_delete(repo_id: str, keep_files: bool) -> None:
     git_sync = get_git_sync()
 
     try:
-        repo = git_sync.git_engine.get_repo(repo_id)
-        if not repo:
+        repo_obj = git_sync.git_engine.get_repo(repo_id)
+        if not repo_obj:
             abort_with_error(f"Repository {repo_id} not found")
 
-        formatter.print_info(f"Deleting repository {repo.name} ({repo_id})")
+        formatter.print_info(f"Deleting repository {repo_obj.name} ({repo_id})")
         git_sync.delete_repository(repo_id, remove_files=not keep_files)
         formatter.print_success("Repository deleted")
         if keep_files:
@@ -528,29 +522,18 @@ def pad_create(title: str, repo_id: Optional[str]) -> None:
     if not repo_id:
         repos = git_engine.list_repos()
         if len(repos) == 0:
-            abort_with_error("No repositories found", "Initialize a repository first: evogitctl repo init --zip app.zip")
-        elif len(repos) == 1:
             abort_with_error(
                 "No repositories found",
                 "Initialize a repository first: evogitctl repo init --zip app.zip",
             )
         if len(repos) == 1:
-            repo = repos[0]
-            repo_id = repo.id
-            formatter.print_info(f"Using repository: {repo.name} ({repo_id})")
+            repo_obj = repos[0]
+            repo_id = repo_obj.id
+            formatter.print_info(f"Using repository: {repo_obj.name} ({repo_id})")
         else:
-            formatter.print_warning("Multiple repositories found. Use --repo to specify an ID.")
-            repo_table = formatter.table(headers=["ID", "Name"])
-            for repo in repos:
-                repo_identifier = getattr(repo, "id", "<unknown>")
-                repo_name = getattr(repo, "name", repo_identifier)
-                repo_table.add_row(f"[cyan]{repo_identifier}[/cyan]", str(repo_name))
-            formatter.print_info_panel(
-                "Multiple repositories detected. Please rerun with --repo <ID>.",
-                title="Repository Selection Required"
             table = formatter.table(headers=["ID", "Name"])
             for repo_obj in repos:
-                table.add_row(f"[cyan]{repo_obj.id}[/cyan]", getattr(repo_obj, "name", repo_obj.id))
+                table.add_row(f"[cyan]{repo_obj.id}[/cyan]", str(getattr(repo_obj, "name", repo_obj.id)))
             formatter.print_panel(
                 "Multiple repositories found. Please rerun with --repo <ID>.",
                 title="Repository Selection Required",
@@ -558,13 +541,7 @@ def pad_create(title: str, repo_id: Optional[str]) -> None:
             formatter.console.print(table)
             raise click.Abort()
 
-    assert repo_id is not None
-
     try:
-        formatter.print_info(f"Creating workpad: {title}")
-        pad_id = git_engine.create_workpad(repo_id, title)
-
-        workpad = git_engine.get_workpad(pad_id)
         assert repo_id is not None
         formatter.print_info(f"Creating workpad: {title}")
         pad_id = git_engine.create_workpad(repo_id, title)
@@ -606,44 +583,21 @@ def pad_list(repo_id: Optional[str]) -> None:
     formatter.print_header(title)
     table = formatter.table(headers=["ID", "Title", "Status", "Checkpoints", "Tests", "Created"])
 
-    for pad in workpads:
-        # Color-code status
-        status_color = "green" if pad.status == "active" else "yellow" if pad.status == "pending" else "red"
-        status_display = f"[{status_color}]{pad.status}[/{status_color}]"
+    format_created = _created_formatter(workpads)
     for pad_obj in workpads:
-        status = getattr(pad_obj, "status", "unknown")
-        status_color = theme.get_status_color(status)
-        status_icon = theme.get_status_icon(status)
-        status_display = f"[{status_color}]{status_icon} {status}[/{status_color}]"
-
         test_status = getattr(pad_obj, "test_status", None)
         if test_status:
-            if test_status.lower() == "passed":
-        test_display = ""
-        if pad.test_status:
-            test_icon = "✅" if pad.test_status == "passed" else "❌" if pad.test_status == "failed" else "⏳"
-            test_display = f"{test_icon} {pad.test_status}"
-        if getattr(pad_obj, "test_status", None):
-            test_status = pad_obj.test_status
-            if test_status == "passed":
-                test_display = "✅ passed"
-            elif test_status.lower() == "failed":
-                test_display = "❌ failed"
-            else:
-                test_display = "⏳ pending"
+            test_display = _WORKPAD_TEST_BADGES.get(test_status.lower(), _PENDING_TEST_BADGE)
         else:
-            test_display = "-"
+            test_display = _NO_TEST_BADGE
 
         table.add_row(
             f"[cyan]{pad_obj.id[:8]}[/cyan]",
             f"[bold]{pad_obj.title}[/bold]",
-            status_display,
-            str(len(pad.checkpoints)),
-            test_display,
-            pad.created_at.strftime('%Y-%m-%d %H:%M')
+            _status_badge(getattr(pad_obj, "status", "unknown")),
             str(len(getattr(pad_obj, "checkpoints", []))),
             test_display,
-            _format_datetime(getattr(pad_obj, "created_at", "")),
+            format_created(getattr(pad_obj, "created_at", "")),
         )
 
     formatter.console.print(table)
@@ -655,10 +609,7 @@ def pad_info(pad_id: str) -> None:
     """Show workpad information."""
 
     git_engine = get_git_engine()
-    workpad = git_engine.get_workpad(pad_id)
-
-    if not workpad:
-        abort_with_error(f"Workpad {pad_id} not found")
+    workpad = _require_workpad(git_engine.get_workpad(pad_id), pad_id)
 
     formatter.print_header(f"Workpad Details: {workpad.title}")
     formatter.print_info(f"Workpad: {workpad.id}")
@@ -716,8 +667,6 @@ def pad_promote(pad_id: str) -> None:
 
         formatter.print_success("Workpad promoted to trunk!")
         formatter.print_info(f"Commit: {commit_hash}")
-        formatter.print_info(f"Branch Removed: {workpad.branch_name}")
-        formatter.print_info(f"Trunk Updated: main @ {commit_hash[:8]}")
 
         details = formatter.table(headers=["Field", "Value"])
         details.add_row("Commit", f"[green]{commit_hash}[/green]")
@@ -735,9 +684,7 @@ def pad_diff(pad_id: str) -> None:
     """Show the diff for a workpad."""
 
     git_engine = get_git_engine()
-    workpad = git_engine.get_workpad(pad_id)
-    if workpad is None:
-        abort_with_error(f"Workpad {pad_id} not found")
+    _require_workpad(git_engine.get_workpad(pad_id), pad_id)
 
     diff_text = git_engine.get_diff(pad_id)
     formatter.print_header("Workpad Diff")
@@ -749,34 +696,22 @@ def test() -> None:
     """Test execution commands."""
 
 
-def _default_tests(target: str) -> Sequence[TestConfig]:
-    """Return a default set of tests for the given target."""
-
-    if target == "fast":
-        return [TestConfig(name="unit-tests", cmd="python -m pytest tests/ -q", timeout=60)]
-
-    return [
-        TestConfig(name="unit-tests", cmd="python -m pytest tests/ -q", timeout=60),
-        TestConfig(name="integration", cmd="python -m pytest tests/integration/ -q", timeout=120),
-    ]
-
-
 @test.command("run")
 @click.argument("pad_id")
 @click.option("--target", type=click.Choice(["fast", "full"]), default="fast", show_default=True)
-def test_run(pad_id: str, target: str) -> None:
+@click.option("--parallel/--sequential", default=True, show_default=True, help="Run tests in parallel")
+def test_run(pad_id: str, target: str, parallel: bool) -> None:
     """Run tests for a workpad."""
 
     git_engine = get_git_engine()
     workpad = _require_workpad(git_engine.get_workpad(pad_id), pad_id)
-    orchestrator = get_test_orchestrator()
-    state_manager = StateManager()
     test_orchestrator = get_test_orchestrator()
+    state_manager = StateManager()
 
     formatter.print_header("Test Execution")
     formatter.print_info(f"Workpad: {workpad.title}")
 
-    test_configs = _build_test_configs(target)
+    tests = list(_default_tests(target))
 
     run_info = state_manager.create_test_run(pad_id, target)
     run_id = getattr(run_info, "run_id", None)
@@ -786,23 +721,7 @@ def test_run(pad_id: str, target: str) -> None:
         except (TypeError, KeyError):
             abort_with_error("Could not determine run_id from test run info")
     state_manager.update_test_run(run_id, status="running")
-
-    try:
-        results = asyncio.run(orchestrator.run_tests(pad_id, tests=test_configs))
-    except Exception as exc:  # pragma: no cover - exercised via tests with mocks
-        logger.exception("Test execution failed for %s", pad_id)
-    if target == 'fast':
-        tests = [
-            TestConfig(name="unit-tests", cmd="python -m pytest tests/ -q", timeout=60),
-        ]
-    else:
-        tests = [
-            TestConfig(name="unit-tests", cmd="python -m pytest tests/ -q", timeout=60),
-            TestConfig(name="integration", cmd="python -m pytest tests/integration/ -q", timeout=120),
-            TestConfig(
-                name="integration", cmd="python -m pytest tests/integration/ -q", timeout=120
-            ),
-    tests = list(_default_tests(target))
+    run_started_at = time.time()
 
     info_panel = "\n".join(
         [
@@ -816,13 +735,6 @@ def test_run(pad_id: str, target: str) -> None:
     formatter.print_panel(info_panel, title="🧪 Test Execution")
 
     try:
-        info = f"""[bold]Workpad:[/bold] {workpad.title}
-[bold]Tests:[/bold] {len(tests)}
-[bold]Execution:[/bold] {'Parallel' if parallel else 'Sequential'}
-[bold]Mode:[/bold] {test_orchestrator.mode.value}
-[bold]Target:[/bold] {target}"""
-        formatter.print_panel(info, title="🧪 Test Execution")
-
         with formatter.create_progress() as progress:
             task_id = progress.add_task(f"Running {target} tests...", total=len(tests))
 
@@ -847,50 +759,29 @@ def test_run(pad_id: str, target: str) -> None:
         formatter.console.print()
 
         table = formatter.table(headers=["Test", "Status", "Duration", "Mode", "Notes", "Log"])
-
-        for result in results:
+        # Notes are already cut to 80 characters, so skip Rich's per-cell overflow handling.
+        for column in table.columns:
+            column.overflow = "ignore"
         state_results: List[StateTestResult] = []
 
         for index, result in enumerate(results):
-            if result.status == TestStatus.PASSED:
-                status_icon = "✅"
-            elif result.status == TestStatus.SKIPPED:
-                status_icon = "⏭️"
-            elif result.status == TestStatus.TIMEOUT:
-                status_icon = "⏱️"
-            elif result.status == TestStatus.ERROR:
-                status_icon = "⚠️"
-            else:
-                status_icon = "❌"
-
-            status_text = f"{status_icon} {result.status.value}"
+            status_text = _TEST_RESULT_BADGES.get(result.status, _TEST_RESULT_BADGES[TestStatus.FAILED])
             duration_s = result.duration_ms / 1000
-            notes = " ".join(segment.strip().replace("\n", " ") for segment in [result.error, result.stderr] if segment)
+            # Truncate before normalising so huge stderr blobs are never scanned in full.
+            notes_raw = " ".join(segment for segment in (result.error, result.stderr) if segment)[:200]
+            notes = _WS_RE.sub(" ", notes_raw).strip()
             if len(notes) > 80:
                 notes = notes[:77] + "..."
             log_display = result.log_path.name if result.log_path else "-"
 
             table.add_row(result.name, status_text, f"{duration_s:.2f}s", result.mode, notes, log_display)
 
-        formatter.console.print(table)
-
-        summary: Dict[str, Any] = test_orchestrator.get_summary(results)
-        status_color = "green" if summary['status'] == 'green' else "red"
-        summary_text = f"""[bold]Total:[/bold] {summary['total']}
-[bold]Passed:[/bold] [green]{summary['passed']}[/green]
-[bold]Failed:[/bold] [red]{summary['failed']}[/red]
-[bold]Timeout:[/bold] {summary['timeout']}
-[bold]Skipped:[/bold] {summary['skipped']}
-[bold]Status:[/bold] [{status_color}]{summary['status'].upper()}[/{status_color}]"""
-
-        formatter.print_panel(summary_text, title="📊 Test Summary")
-
-        workpad.test_status = summary['status']
-            combined_output = "\n".join(
-                segment
-                for segment in [result.stdout or "", result.stderr or ""]
-                if segment
-            )
+            stdout, stderr = result.stdout, result.stderr
+            if stdout and stderr:
+                combined_output = f"{stdout}\n{stderr}"
+            else:
+                # Hand over whichever stream is present without copying it.
+                combined_output = stdout or stderr or ""
 
             state_results.append(
                 StateTestResult(
@@ -924,23 +815,15 @@ def test_run(pad_id: str, target: str) -> None:
             )
             final_status = "failed"
 
-        log_paths = [res.log_path for res in results if res.log_path]
-        if log_paths:
-            formatter.print_info(
-                f"Detailed logs saved to {log_paths[0].parent}"
-            )
-
-    except Exception as exc:
-        formatter.print_error(
-            "Test Execution Failed",
-            "Solo Git could not complete the requested test run.",
-            help_text="Inspect the error details below and confirm the test command is valid in your repository.",
-            tip="Many failures are caused by missing dependencies—run the command locally to reproduce and install prerequisites.",
         formatter.print_info(f"Passed: {passed}")
         formatter.print_info(f"Failed: {failed}")
         formatter.print_info(f"Skipped: {skipped}")
         formatter.print_info(f"Total: {total}")
 
+        log_paths = [res.log_path for res in results if res.log_path]
+        if log_paths:
+            formatter.print_info(f"Detailed logs saved to {log_paths[0].parent}")
+
         duration_ms = sum(result.duration_ms for result in results)
 
         state_manager.update_test_run(
@@ -955,12 +838,13 @@ def test_run(pad_id: str, target: str) -> None:
         )
 
     except Exception as exc:  # pragma: no cover - defensive, but tested via mocks
+        logger.exception("Test execution failed for %s", pad_id)
         duration_ms = int((time.time() - run_started_at) * 1000)
         error_result = StateTestResult(
             test_id=f"{run_id}:orchestrator",
             name="orchestrator",
             status=TestStatus.ERROR.value,
-            duration_ms=0,
+            duration_ms=duration_ms,
             output="",
             error=str(exc),
         )
@@ -971,80 +855,22 @@ def test_run(pad_id: str, target: str) -> None:
             passed=0,
             failed=1,
             skipped=0,
-            duration_ms=0,
+            duration_ms=duration_ms,
             tests=[error_result],
         )
         abort_with_error(
             "Test execution failed",
             str(exc),
             title="Test Execution Failed",
-            help_text="Retry the command once the underlying issue is resolved.",
+            help_text=f"Workpad: {pad_id}",
             tip="Run with --sequential to simplify orchestration when debugging failures.",
             suggestions=[
                 f"evogitctl test run {pad_id}",
                 f"evogitctl test run {pad_id} --target {target}",
             ],
             docs_url="docs/TESTING_GUIDE.md",
-            details=str(exc),
-            help_text=f"Workpad: {pad_id}",
-            suggestions=[f"evogitctl test run {pad_id}"],
-        )
-
-    total = len(results)
-    passed = sum(1 for result in results if result.status == TestStatus.PASSED)
-    failed = sum(1 for result in results if result.status in {TestStatus.FAILED, TestStatus.ERROR, TestStatus.TIMEOUT})
-    skipped = sum(1 for result in results if result.status == TestStatus.SKIPPED)
-    duration_ms = sum(result.duration_ms for result in results)
-
-    for result in results:
-        icon = _STATUS_ICONS.get(result.status, theme.icons.info)
-        formatter.print_info(f"{icon} {result.status.value} — {result.name}")
-
-    formatter.print_subheader("Test Summary")
-
-    if failed == 0:
-        formatter.print_success("All tests passed!")
-    else:
-        formatter.print_warning("Tests Require Attention")
-        formatter.print_info("Some tests failed or timed out. Review results below.")
-
-    summary_table = formatter.table(headers=["Metric", "Value"])
-    summary_table.add_row("Total", str(total))
-    summary_table.add_row("Passed", str(passed))
-    summary_table.add_row("Failed", str(failed))
-    summary_table.add_row("Skipped", str(skipped))
-    summary_table.add_row("Duration (ms)", str(duration_ms))
-    formatter.console.print(summary_table)
-    formatter.print_info(f"Passed: {passed}")
-    formatter.print_info(f"Failed: {failed}")
-    formatter.print_info(f"Skipped: {skipped}")
-
-    state_results: List[StateTestResult] = []
-    for result in results:
-        state_results.append(
-            StateTestResult(
-                test_id=f"{run_id}:{result.name}",
-                name=result.name,
-                status=result.status.value,
-                duration_ms=result.duration_ms,
-                output=(result.stdout or result.stderr or ""),
-                error=result.error,
-            )
         )
 
-    overall_status = "passed" if failed == 0 else "failed"
-
-    state_manager.update_test_run(
-        run_id,
-        status=overall_status,
-        total_tests=total,
-        passed=passed,
-        failed=failed,
-        skipped=skipped,
-        duration_ms=duration_ms,
-        tests=state_results,
-
-
 
 # ============================================================================
 # Phase 3: Auto-Merge and CI Integration Commands
@@ -1076,21 +902,18 @@ def pad_auto_merge(
     4. Auto-promote if approved
     """
     from sologit.workflows.auto_merge import AutoMergeWorkflow
+    from sologit.workflows.ci_orchestrator import CIOrchestrator
     from sologit.workflows.promotion_gate import PromotionRules
+    from sologit.workflows.rollback_handler import RollbackHandler
 
     git_engine = get_git_engine()
     test_orchestrator = get_test_orchestrator()
     state_manager = StateManager()
 
-    workpad = git_engine.get_workpad(pad_id)
-    if workpad is None:
-        abort_with_error(f"Workpad {pad_id} not found")
+    workpad = _require_workpad(git_engine.get_workpad(pad_id), pad_id)
 
-    config_manager: ConfigManager
-    if ctx.obj and isinstance(ctx.obj, dict) and 'config' in ctx.obj:
-        config_manager = cast(ConfigManager, ctx.obj['config'])
-    else:
-        config_manager = ConfigManager()
+    context_obj = ctx.obj if isinstance(ctx.obj, dict) else {}
+    config_manager = cast(ConfigManager, context_obj.get('config') or get_config_manager())
     config_tests = config_manager.config.tests
     default_timeout = config_tests.timeout_seconds
 
@@ -1101,15 +924,7 @@ def pad_auto_merge(
         tests = _tests_from_config_entries(suite_entries, default_timeout)
 
         if not tests:
-            if target == 'fast':
-                tests = [
-                    TestConfig(name="unit-tests", cmd="python -m pytest tests/ -q", timeout=60),
-                ]
-            else:
-                tests = [
-                    TestConfig(name="unit-tests", cmd="python -m pytest tests/ -q", timeout=60),
-                    TestConfig(name="integration", cmd="python -m pytest tests/integration/ -q", timeout=120),
-                ]
+            tests = list(_default_tests(target))
 
     # Configure promotion rules (can be loaded from config in future)
     rules = PromotionRules(
@@ -1118,9 +933,15 @@ def pad_auto_merge(
         require_fast_forward=True
     )
 
-    smoke_tests = _tests_from_config_entries(config_tests.smoke_tests, default_timeout)
-    ci_orchestrator = CIOrchestrator(git_engine, test_orchestrator)
-    rollback_handler = RollbackHandler(git_engine)
+    # CI smoke runs and rollbacks only follow a promotion, so skip building
+    # them when promotion is disabled.
+    ci_orchestrator: Optional[CIOrchestrator] = None
+    rollback_handler: Optional[RollbackHandler] = None
+    smoke_tests: List[TestConfig] = []
+    if not no_auto_promote:
+        smoke_tests = _tests_from_config_entries(config_tests.smoke_tests, default_timeout)
+        ci_orchestrator = CIOrchestrator(git_engine, test_orchestrator)
+        rollback_handler = RollbackHandler(git_engine)
 
     workflow = AutoMergeWorkflow(
         git_engine,
@@ -1134,19 +955,6 @@ def pad_auto_merge(
         rollback_on_ci_red=config_manager.config.rollback_on_ci_red
     )
 
-    formatter.print_header("Auto-Merge Workflow")
-    overview = formatter.table(headers=["Field", "Value"])
-    overview.add_row("Workpad", f"[bold]{workpad.title}[/bold] ({workpad.id[:8]})")
-    overview.add_row("Target", target)
-    overview.add_row("Auto-promote", "Enabled" if not no_auto_promote else "Disabled")
-    overview.add_row("Tests", str(len(tests)))
-    formatter.console.print(overview)
-
-    # Execute workflow
-    result = workflow.execute(
-            pad_id, tests, parallel=True, auto_promote=not no_auto_promote, target=target
-        )
-
     try:
         formatter.print_header("Auto-Merge Workflow")
         overview = formatter.table(headers=["Field", "Value"])
@@ -1172,6 +980,8 @@ def pad_auto_merge(
         if not result.success and result.promotion_decision and not result.promotion_decision.can_promote:
             raise click.Abort()
 
+    except click.Abort:
+        raise
     except Exception as e:
         abort_with_error("Auto-merge failed", str(e))
 
@@ -1188,9 +998,7 @@ def pad_evaluate(pad_id: str) -> None:
 
     git_engine = get_git_engine()
 
-    workpad = git_engine.get_workpad(pad_id)
-    if workpad is None:
-        abort_with_error(f"Workpad {pad_id} not found")
+    workpad = _require_workpad(git_engine.get_workpad(pad_id), pad_id)
 
     # Configure rules
     rules = PromotionRules(
@@ -1199,15 +1007,46 @@ def pad_evaluate(pad_id: str) -> None:
         require_fast_forward=True
     )
 
-    if failed == 0:
-        formatter.print_success("Test run completed successfully.")
-    else:
-        formatter.print_warning("Test run completed with failures.")
+    gate = PromotionGate(git_engine, rules)
+
+    try:
+        formatter.print_header("Promotion Gate Evaluation")
+        formatter.print_info(f"Workpad: {workpad.title}")
+
+        decision = gate.evaluate(pad_id)
+        formatter.print_info_panel(gate.format_decision(decision), title="Promotion Decision")
+
+    except Exception as e:
+        abort_with_error("Evaluation failed", str(e))
+
+
+@test.command('analyze')
+@click.argument('pad_id')
+def test_analyze(pad_id: str) -> None:
+    """
+    Analyze test failures for a workpad (Phase 3).
+
+    Shows failure patterns and suggested fixes.
+    """
+    git_engine = get_git_engine()
+
+    _require_workpad(git_engine.get_workpad(pad_id), pad_id)
+
+    # Check if tests have been run
+    # In a full implementation, we'd cache test results
+    # For now, prompt user to run tests first
+
+    formatter.print_header("Test Failure Analysis")
+    formatter.print_warning("Test analysis requires recent test results.")
+    formatter.print_info(f"Run: [bold]evogitctl test run {pad_id}[/bold] before analyzing.")
+    formatter.print_info_panel(
+        "In Phase 3, test results will be cached and analyzed automatically.",
+        title="Coming Soon"
+    )
 
 
 @click.group()
 def ci() -> None:
-    """Continuous integration helper commands."""
     """Continuous integration orchestration commands."""
 
 
@@ -1220,15 +1059,10 @@ def ci_smoke(repo_id: str, commit: Optional[str]) -> None:
 
     This simulates post-merge CI smoke tests.
     """
-    from sologit.workflows.ci_orchestrator import CIOrchestrator
-
     git_engine = get_git_engine()
-    test_orchestrator = get_test_orchestrator()
 
-    repo = git_engine.get_repo(repo_id)
-    if not repo:
-        abort_with_error(f"Repository {repo_id} not found")
-    
+    repo_obj = _require_repository(git_engine.get_repo(repo_id), repo_id)
+
     # Get commit hash
     if not commit:
         # Get HEAD commit
@@ -1240,16 +1074,15 @@ def ci_smoke(repo_id: str, commit: Optional[str]) -> None:
         TestConfig(name="smoke-unit", cmd="python -m pytest tests/ -q --tb=no", timeout=60),
     ]
 
-    # Create orchestrator
-    orchestrator = CIOrchestrator(git_engine, test_orchestrator)
-    
+    orchestrator = get_ci_orchestrator()
+
     def progress_callback(message: str) -> None:
         formatter.print(f"   {message}")
 
     try:
         formatter.print_header("CI Smoke Tests")
         info_table = formatter.table(headers=["Field", "Value"])
-        info_table.add_row("Repository", f"{repo.name} ({repo_id})")
+        info_table.add_row("Repository", f"{repo_obj.name} ({repo_id})")
         info_table.add_row("Commit", commit[:8])
         info_table.add_row("Tests", str(len(smoke_tests)))
         formatter.console.print(info_table)
@@ -1269,6 +1102,8 @@ def ci_smoke(repo_id: str, commit: Optional[str]) -> None:
         if result.is_red:
             raise click.Abort()
 
+    except click.Abort:
+        raise
     except Exception as e:
         abort_with_error("Smoke tests failed", str(e))
 
@@ -1283,17 +1118,13 @@ def ci_rollback(repo_id: str, commit: str, recreate_pad: bool) -> None:
 
     Reverts the specified commit and optionally recreates a workpad.
     """
-    from sologit.workflows.rollback_handler import RollbackHandler
     from sologit.workflows.ci_orchestrator import CIResult, CIStatus
 
     git_engine = get_git_engine()
 
-    repo = git_engine.get_repo(repo_id)
-    if not repo:
-        abort_with_error(f"Repository {repo_id} not found")
+    repo_obj = _require_repository(git_engine.get_repo(repo_id), repo_id)
 
-    # Create handler
-    handler = RollbackHandler(git_engine)
+    handler = get_rollback_handler()
 
     # Create a fake CI result for the rollback
     fake_ci_result = CIResult(
@@ -1308,7 +1139,7 @@ def ci_rollback(repo_id: str, commit: str, recreate_pad: bool) -> None:
     try:
         formatter.print_header("CI Rollback")
         info_table = formatter.table(headers=["Field", "Value"])
-        info_table.add_row("Repository", f"{repo.name} ({repo_id})")
+        info_table.add_row("Repository", f"{repo_obj.name} ({repo_id})")
         info_table.add_row("Commit", commit[:8])
         info_table.add_row("Recreate Workpad", "Yes" if recreate_pad else "No")
         formatter.console.print(info_table)
@@ -1323,42 +1154,10 @@ def ci_rollback(repo_id: str, commit: str, recreate_pad: bool) -> None:
         if not result.success:
             raise click.Abort()
 
-
-@ci.command("trigger")
-@click.argument("pipeline")
-def ci_trigger(pipeline: str) -> None:
-    """Trigger a CI pipeline (placeholder implementation)."""
-
-    formatter.print_warning(
-        "CI integration is not configured for this environment."
-@test.command('analyze')
-@click.argument('pad_id')
-def test_analyze(pad_id: str) -> None:
-    """
-    Analyze test failures for a workpad (Phase 3).
-
-    Shows failure patterns and suggested fixes.
-    """
-    from sologit.analysis.test_analyzer import TestAnalyzer
-
-    git_engine = get_git_engine()
-    test_orchestrator = get_test_orchestrator()
-
-    workpad = git_engine.get_workpad(pad_id)
-    if not workpad:
-        abort_with_error(f"Workpad {pad_id} not found")
-
-    # Check if tests have been run
-    # In a full implementation, we'd cache test results
-    # For now, prompt user to run tests first
-
-    formatter.print_header("Test Failure Analysis")
-    formatter.print_warning("Test analysis requires recent test results.")
-    formatter.print_info(f"Run: [bold]evogitctl test run {pad_id}[/bold] before analyzing.")
-    formatter.print_info_panel(
-        "In Phase 3, test results will be cached and analyzed automatically.",
-        title="Coming Soon"
-    )
+    except click.Abort:
+        raise
+    except Exception as e:
+        abort_with_error("Rollback failed", str(e))
 
 
 # ============================================================================
@@ -1397,11 +1196,6 @@ def execute_pair_loop(
         target: Test target (fast/full)
     """
     from sologit.orchestration.ai_orchestrator import AIOrchestrator
-    from sologit.engines.patch_engine import PatchEngine
-    from sologit.workflows.auto_merge import AutoMergeWorkflow
-    from sologit.workflows.promotion_gate import PromotionRules
-
-    import time
 
     git_engine = get_git_engine()
     if ctx.obj and isinstance(ctx.obj, dict) and 'config' in ctx.obj:
@@ -1424,8 +1218,8 @@ def execute_pair_loop(
             formatter.print_info(f"Using repository: {repos[0].name} ({repo_id})")
         else:
             repo_table = formatter.table(headers=["ID", "Name", "Trunk"])
-            for repo in repos:
-                repo_table.add_row(f"[cyan]{repo.id}[/cyan]", repo.name, repo.trunk_branch)
+            for repo_obj in repos:
+                repo_table.add_row(f"[cyan]{repo_obj.id}[/cyan]", repo_obj.name, repo_obj.trunk_branch)
             formatter.print_info_panel(
                 "Multiple repositories detected. Re-run with --repo <ID> to specify the target.",
                 title="Repository Selection Required"
@@ -1433,10 +1227,10 @@ def execute_pair_loop(
             formatter.console.print(repo_table)
             raise click.Abort()
 
+    assert repo_id is not None
+
     # Validate repository exists
-    repo = git_engine.get_repo(repo_id)
-    if not repo:
-        abort_with_error(f"Repository {repo_id} not found")
+    repo_obj = _require_repository(git_engine.get_repo(repo_id), repo_id)
 
     # Step 2: Create workpad title if missing
     if not title:
@@ -1446,7 +1240,7 @@ def execute_pair_loop(
         title = '-'.join(filter(None, title.split('-')))
 
     overview = formatter.table(headers=["Field", "Value"])
-    overview.add_row("Repository", f"{repo.name} ({repo_id})")
+    overview.add_row("Repository", f"{repo_obj.name} ({repo_id})")
     overview.add_row("Prompt", prompt)
     overview.add_row("Workpad Title", title)
     overview.add_row("Tests", "Skipped" if no_test else target)
@@ -1459,13 +1253,13 @@ def execute_pair_loop(
         formatter.print_subheader("Workpad Setup")
         formatter.print_info("Creating ephemeral workpad...")
         pad_id = git_engine.create_workpad(repo_id, title)
-        workpad = git_engine.get_workpad(pad_id)
+        workpad = _require_workpad(git_engine.get_workpad(pad_id), pad_id)
         formatter.print_success("Workpad created")
 
         workpad_table = formatter.table(headers=["Field", "Value"])
         workpad_table.add_row("Workpad ID", f"[cyan]{pad_id}[/cyan]")
         workpad_table.add_row("Branch", workpad.branch_name)
-        workpad_table.add_row("Base", repo.trunk_branch)
+        workpad_table.add_row("Base", repo_obj.trunk_branch)
         formatter.console.print(workpad_table)
 
         # Step 3: AI Planning
@@ -1478,9 +1272,9 @@ def execute_pair_loop(
         repo_map = git_engine.get_repo_map(repo_id)
         context = {
             'repo_id': repo_id,
-            'repo_name': repo.name,
+            'repo_name': repo_obj.name,
             'file_tree': repo_map,
-            'trunk_branch': repo.trunk_branch
+            'trunk_branch': repo_obj.trunk_branch
         }
 
         plan_response = orchestrator.plan(
@@ -1562,26 +1356,22 @@ def execute_pair_loop(
                     TestConfig(name="unit-tests", cmd="python -m pytest tests/ -q --tb=short", timeout=60),
                     TestConfig(name="integration", cmd="python -m pytest tests/integration/ -q --tb=short", timeout=120),
                 ]
-@ci.command("status")
-@click.argument("repo_id")
-def ci_status(repo_id: str) -> None:
-    """Display CI status information for a repository."""
 
             test_orchestrator = get_test_orchestrator()
             results = test_orchestrator.run_tests_sync(pad_id, tests, parallel=True)
 
             results_table = formatter.table(headers=["Test", "Status", "Duration", "Notes"])
             all_passed = True
-            for result in results:
-                is_passed = result.status.value == "passed"
-                status_color = theme.get_status_color(result.status.value)
-                status_icon = theme.get_status_icon(result.status.value)
-                duration_s = result.duration_ms / 1000
-                notes = (result.stdout or result.stderr or "").split('\n')
+            for test_result in results:
+                is_passed = test_result.status.value == "passed"
+                status_color = theme.get_status_color(test_result.status.value)
+                status_icon = theme.get_status_icon(test_result.status.value)
+                duration_s = test_result.duration_ms / 1000
+                notes = (test_result.stdout or test_result.stderr or "").split('\n')
                 summary_note = next((line for line in notes if line.strip()), "")
                 results_table.add_row(
-                    result.name,
-                    f"[{status_color}]{status_icon} {result.status.value.upper()}[/{status_color}]",
+                    test_result.name,
+                    f"[{status_color}]{status_icon} {test_result.status.value.upper()}[/{status_color}]",
                     f"{duration_s:.1f}s",
                     summary_note[:80]
                 )
@@ -1605,7 +1395,7 @@ def ci_status(repo_id: str) -> None:
                 try:
                     commit_hash = git_engine.promote_workpad(pad_id)
                     formatter.print_success_panel(
-                        f"Commit: {commit_hash}\nBranch: {repo.trunk_branch}",
+                        f"Commit: {commit_hash}\nBranch: {repo_obj.trunk_branch}",
                         title="Promotion Complete"
                     )
 
@@ -1626,13 +1416,6 @@ def ci_status(repo_id: str) -> None:
                 formatter.print_info(f"Run tests: evogitctl test run {pad_id}")
                 formatter.print_info(f"Promote manually: evogitctl pad promote {pad_id}")
                 raise click.Abort()
-    formatter.print_header("CI Status")
-    formatter.print_info(f"Repository: {repo_id}")
-    formatter.print_info(
-        "CI orchestration helpers are not fully configured in this testing build."
-    )
-    formatter.print_info(f"Requested pipeline: {pipeline}")
-
 
         else:
             formatter.print_warning(
@@ -1649,23 +1432,5 @@ def ci_status(repo_id: str) -> None:
         logger.exception("Pair loop failed")
         abort_with_error(
             "Unexpected error during pair session",
-            f"Workpad may be in inconsistent state: {pad_id if 'pad_id' in locals() else 'N/A'}\n{e}"
+            f"Workpad may be in inconsistent state: {pad_id or 'N/A'}\n{e}"
         )
-def execute_pair_loop(
-    *,
-    ctx: click.Context,
-    prompt: str,
-    repo_id: Optional[str] = None,
-    title: Optional[str] = None,
-    no_test: bool = False,
-    no_promote: bool = False,
-    target: str = "fast",
-) -> None:
-    """Placeholder pair-programming loop used by the CLI."""
-
-    formatter.print_warning(
-        "AI pair programming is not available in this build.",
-    )
-    formatter.print_info(
-        "Requested prompt: %s" % prompt
-    )
@@ -5,22 +5,29 @@ Configuration commands for Solo Git CLI.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
 from pathlib import Path
-from typing import Any, Dict, Iterable, NoReturn, Optional, cast
-from typing import Any, Dict, Iterable, List, NoReturn, Optional, cast
-from typing import Dict, Iterable, NoReturn, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, NoReturn, Optional, TypeVar, cast
 
 import click
-from rich.console import Console
+from rich.console import Group
 
-from sologit.api.client import AbacusClient
-from sologit.config.manager import BudgetConfig, ConfigManager
-from sologit.config.templates import DEFAULT_CONFIG_TEMPLATE, ENV_TEMPLATE
-from sologit.orchestration.cost_guard import CostGuard
+from sologit.config.manager import BudgetConfig, ConfigManager, ModelVariantConfig
 from sologit.ui.formatter import RichFormatter
 from sologit.ui.theme import theme
 from sologit.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 logger = get_logger(__name__)
 
 formatter = RichFormatter()
@@ -31,99 +38,98 @@ def set_formatter_console(console: Console) -> None:
     formatter.set_console(console)
 
 
-    """Allow external callers to reuse a shared Rich console."""
-
 def _ensure_context(ctx: click.Context) -> Dict[str, Any]:
     """Ensure the Click context has an initialized object dictionary and return it."""
-    ctx.ensure_object(dict)
-    return cast(Dict[str, Any], ctx.obj)
+    return cast(Dict[str, Any], ctx.ensure_object(dict))
 
 
 def _get_config_manager(ctx: click.Context) -> ConfigManager:
-    """Retrieve a ConfigManager instance from the context or create one."""
+    """Fetch a ConfigManager attached to the Click context."""
+
     context_obj = _ensure_context(ctx)
-    config_manager = context_obj.get('config')
-    if config_manager is None:
-        config_manager = ConfigManager()
-        context_obj['config'] = config_manager
-    return config_manager
-    formatter.set_console(console)
+    manager = context_obj.get("config")
+    if manager is None:
+        manager = context_obj["config"] = ConfigManager()
+    return cast(ConfigManager, manager)
 
 
-def abort_with_error(
-    message: str,
-    details: Optional[str] = None,
-    *,
-    title: Optional[str] = None,
-    help_text: Optional[str] = None,
-    tip: Optional[str] = None,
-    suggestions: Optional[Iterable[str]] = None,
-    docs_url: Optional[str] = None,
-) -> NoReturn:
-    """Render a formatted error panel and abort the command."""
-    """Display a formatted error panel with context and abort the command."""
+_TIER_FMT = "{name} ({provider}) • ${cost:.4f}/1k • max {max_tokens} tokens"
 
-    formatter.print_error(
-        title or "Configuration Error",
-        message,
-        help_text=help_text or "Review the command usage below and adjust the provided arguments.",
-        tip=tip or "Run 'evogitctl config --help' to list available options.",
-        suggestions=suggestions or [
-            "evogitctl config show",
-            "evogitctl config setup",
-        ],
-        docs_url=docs_url or "docs/SETUP.md#configuration",
-        details=details,
-    )
-    raise click.Abort()
 
+@functools.lru_cache(maxsize=64)
+def _format_model_row(name: str, provider: str, cost: float, max_tokens: int) -> str:
+    """Format a model variant summary; tiers often share identical variants."""
 
-def _ensure_context(ctx: click.Context) -> Dict[str, Any]:
-    """Ensure the Click context stores a mutable dictionary."""
-def abort_with_error(message: str, details: Optional[str] = None) -> NoReturn:
-    """Display a formatted error and exit."""
-    plain_message = f"Error: {message}"
-    formatter.print_error(plain_message)
+    return _TIER_FMT.format(name=name, provider=provider, cost=cost, max_tokens=max_tokens)
 
-    content = f"[bold]{plain_message}[/bold]"
-    if details:
-        content += f"\n\n{details}"
-    formatter.print_error_panel(content)
-    sys.exit(1)
 
-    sys.exit(1)
+def _render_tier(variant: Optional[ModelVariantConfig]) -> str:
+    """Return a one-line summary of a tier's model variant."""
 
+    if variant is None:
+        return "—"
+    return _format_model_row(
+        variant.name, variant.provider, variant.cost_per_1k_tokens, variant.max_tokens
+    )
 
-@click.group(name='config')
-    raise click.Abort()
 
+def _write_text_atomic(path: Path, content: str, *, mode: int = 0o644, exclusive: bool = False) -> None:
+    """Write ``content`` to ``path`` with permissions ``mode`` from the first byte.
 
-def _ensure_context(ctx: click.Context) -> Dict[str, object]:
-    """Ensure the Click context carries a dictionary object."""
+    Normally the text goes to a fresh temp file in the same directory, which
+    then replaces ``path``. With ``exclusive`` the file is created directly
+    with ``O_EXCL``, so ``FileExistsError`` is raised instead of overwriting an
+    existing file.
+    """
 
-    ctx.ensure_object(dict)
-    return ctx.obj  # type: ignore[return-value]
+    data = content.encode("utf-8")
+    if exclusive:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+        return
 
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            os.fchmod(handle.fileno(), mode)
+            handle.write(data)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
 
-def _get_config_manager(ctx: click.Context) -> ConfigManager:
-    """Fetch a ConfigManager attached to the Click context."""
 
-    context_obj = _ensure_context(ctx)
-    manager = context_obj.get("config")  # type: ignore[assignment]
-    if manager is None:
-        manager = ConfigManager()
-        context_obj["config"] = manager
-    return cast(ConfigManager, manager)
+T = TypeVar("T")
+
+
+def _call_with_timeout(func: Callable[[], T], timeout: float) -> T:
+    """Run ``func`` on a daemon thread and give up after ``timeout`` seconds.
+
+    A daemon thread is used rather than an executor so that a hung request
+    does not keep the process alive once the command has reported the timeout.
+    """
 
+    outcome: Dict[str, Any] = {}
 
-def _mask_secret(secret: Optional[str]) -> str:
-    """Return a masked representation of a secret value."""
+    def _target() -> None:
+        try:
+            outcome["value"] = func()
+        except BaseException as exc:  # pragma: no cover - re-raised below
+            outcome["error"] = exc
 
-    if not secret:
-        return "<not configured>"
-    if len(secret) <= 12:
-        return secret
-    return f"{secret[:8]}...{secret[-4:]}"
+    worker = threading.Thread(target=_target, name="sologit-config-probe", daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise TimeoutError(f"Timed out after {timeout}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return cast(T, outcome["value"])
 
 
 def _format_currency(amount: Optional[float]) -> str:
@@ -134,6 +140,9 @@ def _format_currency(amount: Optional[float]) -> str:
     return f"${amount:.2f}"
 
 
+_DEFAULT_ERROR_SUGGESTIONS = ("evogitctl config show", "evogitctl config setup")
+
+
 def abort_with_error(
     message: str,
     details: Optional[str] = None,
@@ -150,10 +159,7 @@ def abort_with_error(
         message,
         help_text=help_text or "Review the command usage below and update the provided arguments.",
         tip=tip or "Run 'evogitctl config --help' to list available options.",
-        suggestions=suggestions or [
-            "evogitctl config show",
-            "evogitctl config setup",
-        ],
+        suggestions=suggestions or _DEFAULT_ERROR_SUGGESTIONS,
         docs_url=docs_url or "docs/SETUP.md#configuration",
         details=details,
     )
@@ -165,23 +171,70 @@ def config_group() -> None:
     """Configuration management commands."""
 
 
+_DEFAULT_ENDPOINT = "https://api.abacus.ai/v1"
+
+
+def _default_endpoint() -> str:
+    """Resolve the ``--endpoint`` default from the saved config at run time.
+
+    Click only calls this when the option is omitted, and it is skipped during
+    shell completion so tab-completion never loads the configuration.
+    """
+
+    ctx = click.get_current_context(silent=True)
+    if ctx is None or ctx.resilient_parsing:
+        return _DEFAULT_ENDPOINT
+    try:
+        endpoint = _get_config_manager(ctx).get_config().abacus.endpoint
+    except Exception:  # pragma: no cover - fall back to the public endpoint
+        return _DEFAULT_ENDPOINT
+    return endpoint if isinstance(endpoint, str) and endpoint else _DEFAULT_ENDPOINT
+
+
+def _read_setup_payload(stream: Any) -> Dict[str, str]:
+    """Parse ``key=value`` lines piped to ``config setup`` in a single read."""
+
+    payload: Dict[str, str] = {}
+    for line in stream.read().splitlines():
+        key, sep, value = line.partition("=")
+        if sep and value.strip():
+            payload[key.strip().lower()] = value.strip()
+    return payload
+
+
 @config_group.command(name="setup")
-@click.option("--api-key", help="Abacus.ai API key")
-@click.option("--endpoint", help="Abacus.ai API endpoint", default="https://api.abacus.ai/v1")
-@click.option("--interactive/--no-interactive", default=True, help="Interactive setup mode")
-def setup_config(api_key: Optional[str], endpoint: Optional[str], interactive: bool) -> None:
+@click.option("--api-key", envvar="ABACUS_API_KEY", show_envvar=True, help="Abacus.ai API key")
+@click.option(
+    "--endpoint", help="Abacus.ai API endpoint",
+    default=_default_endpoint, show_default="saved endpoint or " + _DEFAULT_ENDPOINT,
+)
+@click.option(
+    "--interactive/--no-interactive", default=True,
+    help="Interactive setup mode (prompts only on a terminal; piped stdin is read as api_key=/endpoint= lines)",
+)
+@click.pass_context
+def setup_config(
+    ctx: click.Context, api_key: Optional[str], endpoint: Optional[str], interactive: bool
+) -> None:
     """Guided Abacus.ai configuration setup."""
 
+    # Without a terminal there is nobody to prompt, so skip the prompt path entirely.
+    stdin_is_tty = sys.stdin.isatty()
+    if interactive and not stdin_is_tty:
+        interactive = False
+
     formatter.print_header("Solo Git Configuration Setup")
     formatter.print_info("Guiding you through Abacus.ai credential setup.")
 
-    config_manager = ConfigManager()
+    config_manager = _get_config_manager(ctx)
 
     if config_manager.has_abacus_credentials() and interactive:
-        formatter.print_warning("Existing configuration detected.")
-        if not click.confirm("Configuration already exists. Overwrite?", default=False):
-            formatter.print_info("Keeping existing configuration.")
-            return
+        formatter.print_warning("Existing configuration detected; saved credentials will be replaced.")
+
+    if not api_key and not stdin_is_tty:
+        payload = _read_setup_payload(sys.stdin)
+        api_key = payload.get("api_key")
+        endpoint = payload.get("endpoint", endpoint)
 
     if interactive and not api_key:
         formatter.print_panel(
@@ -190,8 +243,8 @@ def setup_config(api_key: Optional[str], endpoint: Optional[str], interactive: b
             title="Abacus.ai Credentials"
         )
         api_key = click.prompt("Enter your Abacus.ai API key", hide_input=True)
-        if click.confirm("Use default endpoint (https://api.abacus.ai/v1)?", default=True):
-            endpoint = 'https://api.abacus.ai/v1'
+        if click.confirm(f"Use default endpoint ({_DEFAULT_ENDPOINT})?", default=True):
+            endpoint = _DEFAULT_ENDPOINT
         else:
             endpoint = click.prompt("Enter custom API endpoint")
 
@@ -208,10 +261,9 @@ def setup_config(api_key: Optional[str], endpoint: Optional[str], interactive: b
         )
 
     try:
-        config_manager.set_abacus_credentials(api_key, endpoint or "https://api.abacus.ai/v1")
-        config_path = Path(getattr(config_manager, "config_path", ConfigManager.DEFAULT_CONFIG_FILE))
+        config_manager.set_abacus_credentials(api_key, endpoint or _DEFAULT_ENDPOINT)
         formatter.print_success_panel(
-            f"Configuration saved to [bold]{config_path}[/bold]",
+            f"Configuration saved to [bold]{config_manager.config_path}[/bold]",
             title="Configuration Saved"
         )
 
@@ -236,6 +288,22 @@ def setup_config(api_key: Optional[str], endpoint: Optional[str], interactive: b
         )
 
 
+def _get_cost_guard(ctx: click.Context, budget: BudgetConfig) -> Any:
+    """Return the CostGuard shared on the Click context, building it on first use.
+
+    The guard is not kept beyond the invocation. Another process can record
+    usage or alerts at any time, so each command reads a fresh ledger.
+    """
+
+    context_obj = _ensure_context(ctx)
+    guard = context_obj.get("cost_guard")
+    if guard is None:
+        from sologit.orchestration.cost_guard import CostGuard
+
+        guard = context_obj["cost_guard"] = CostGuard(budget)
+    return guard
+
+
 @config_group.command(name='show')
 @click.option('--secrets/--no-secrets', default=False,
               help='Show API keys (masked by default)')
@@ -250,16 +318,27 @@ def show_config(ctx: click.Context, secrets: bool) -> None:
 
     api_table = formatter.table(headers=["Field", "Value"])
     api_table.add_row("Endpoint", config.abacus.endpoint)
-    api_key_display = config.abacus.api_key if secrets else _mask_secret(config.abacus.api_key)
+    if secrets:
+        api_key_display = config.abacus.api_key or "<not configured>"
+    else:
+        api_key_display = config.abacus.masked_key or "<not configured>"
     api_table.add_row("API Key", api_key_display)
-    formatter.console.print(api_table)
+
+    models_table = formatter.table(headers=["Tier", "Primary", "Fallback"])
+    for label, tier in (
+        ("Planning", config.models.planning),
+        ("Coding", config.models.coding),
+        ("Fast", config.models.fast),
+    ):
+        models_table.add_row(label, _render_tier(tier.primary), _render_tier(tier.fallback))
 
     budget_table = formatter.table(headers=["Budget", "Value"])
-    daily_cap = getattr(config.budget, 'daily_usd_cap', None)
-    alert_threshold = getattr(config.budget, 'alert_threshold', None)
-    budget_table.add_row("Daily Cap", _format_currency(daily_cap))
+    budget = config.budget
+    alert_threshold = budget.alert_threshold
+    budget_table.add_row("Daily Cap", _format_currency(budget.daily_usd_cap))
     budget_table.add_row("Alert Threshold", f"{alert_threshold:.0%}" if alert_threshold is not None else "Not configured")
-    formatter.console.print(budget_table)
+    # Render all tables as one group so the console is written to once.
+    formatter.console.print(Group(api_table, models_table, budget_table))
     formatter.print_subheader("Next Steps")
     formatter.print_bullet_list(
         [
@@ -272,14 +351,50 @@ def show_config(ctx: click.Context, secrets: bool) -> None:
     )
 
 
+# Successful ``config test`` connection checks are trusted for a minute, so
+# scripted diagnostics that repeat the command skip the network round-trip.
+_CONNECTION_OK_TTL = 60.0
+
+
+def _connection_cache_path() -> Path:
+    return Path.home() / ".sologit" / "cli_connection_ok.json"
+
+
+def _connection_cache_key(endpoint: str, api_key: str) -> list:
+    """Return the key a cached connection verdict must match to be trusted."""
+
+    return [endpoint, hashlib.sha256(api_key.encode("utf-8")).hexdigest()]
+
+
+def _connection_recently_ok(key: list) -> bool:
+    try:
+        data = json.loads(_connection_cache_path().read_text(encoding="utf-8"))
+        fresh: bool = data["key"] == key and 0 <= time.time() - data["ok_at"] < _CONNECTION_OK_TTL
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    return fresh
+
+
+def _record_connection_ok(key: list) -> None:
+    path = _connection_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_text_atomic(path, json.dumps({"key": key, "ok_at": time.time()}), mode=0o600)
+    except OSError as exc:
+        logger.debug("Could not record connection check: %s", exc)
+
+
 @config_group.command(name='test')
+@click.option('--timeout', type=click.IntRange(min=1), default=10, show_default=True,
+              help='Seconds to wait for the API connection check')
+@click.option('--no-cache', is_flag=True, help='Always probe the API, even if it answered in the last minute.')
 @click.pass_context
-def test_config(ctx: click.Context) -> None:
+def test_config(ctx: click.Context, timeout: int, no_cache: bool) -> None:
     """Validate configuration and test the Abacus.ai API connection."""
 
     formatter.print_header("Solo Git Configuration Test")
 
-    config_manager = ConfigManager()
+    config_manager = _get_config_manager(ctx)
     is_valid, issues = config_manager.validate()
 
     if not is_valid:
@@ -290,6 +405,7 @@ def test_config(ctx: click.Context) -> None:
             help_text="Review the issues below and update your configuration.",
             tip="Run 'evogitctl config show' to inspect the current values.",
         )
+    formatter.print_success("Configuration is valid")
 
     config = config_manager.get_config()
     if not config.abacus.is_configured():
@@ -299,92 +415,144 @@ def test_config(ctx: click.Context) -> None:
             help_text="Run 'evogitctl config setup' to provide API credentials.",
         )
 
-    client = AbacusClient(config.abacus)
-    connection_ok = client.test_connection()
-
-    if not connection_ok:
+    endpoint = config.abacus.endpoint or ""
+    if not endpoint.startswith(("http://", "https://")):
+        # Fail locally instead of waiting on DNS or a socket timeout.
         abort_with_error(
-            "API connection failed",
-            "Unable to connect to Abacus.ai with the provided credentials.",
-            title="API Connection Failed",
-            help_text="Confirm the API key is active and has permission to call Abacus.ai endpoints.",
-            tip="Generate a fresh API key from the Abacus.ai dashboard and try again.",
+            "Invalid endpoint URL",
+            f"Endpoint {endpoint!r} is not an http(s) URL.",
+            title="Configuration Incomplete",
+            help_text="Set the Abacus.ai endpoint to a full URL such as " + _DEFAULT_ENDPOINT + ".",
+            tip="Run 'evogitctl config setup --endpoint <url>' to update it.",
         )
 
+    from sologit.api.client import AbacusClient
+
+    cache_key = None if no_cache else _connection_cache_key(endpoint, config.abacus.api_key or "")
+    if cache_key and _connection_recently_ok(cache_key):
+        formatter.print_success("API connection successful (cached)")
+    else:
+        client = AbacusClient(config.abacus)
+        try:
+            connection_ok = _call_with_timeout(client.test_connection, timeout)
+        except TimeoutError:
+            abort_with_error(
+                f"API connection timed out after {timeout}s",
+                title="API Connection Timed Out",
+                help_text="The Abacus.ai endpoint did not answer in time.",
+                tip="Check network access to the endpoint or retry with a larger --timeout.",
+            )
+
+        if not connection_ok:
+            abort_with_error(
+                "API connection failed",
+                "Unable to connect to Abacus.ai with the provided credentials.",
+                title="API Connection Failed",
+                help_text="Confirm the API key is active and has permission to call Abacus.ai endpoints.",
+                tip="Generate a fresh API key from the Abacus.ai dashboard and try again.",
+            )
+        if cache_key:
+            _record_connection_ok(cache_key)
+        formatter.print_success("API connection successful")
+
     formatter.print_success_panel(
         "All checks passed! Solo Git is ready to use.",
         title="Ready"
     )
 
 
+# ``budget status`` snapshots: reused across invocations for a couple of seconds
+# while the usage ledger is untouched, so tight polling loops skip CostGuard.
+_STATUS_SNAPSHOT_TTL = 2.0
+
+
+def _status_snapshot_path() -> Path:
+    return Path.home() / ".sologit" / "cli_budget_status.json"
+
+
+def _status_snapshot_key(budget: BudgetConfig) -> list:
+    """Return the key a status snapshot must match to be reused."""
+
+    from sologit.orchestration.cost_guard import CostTracker
+
+    try:
+        usage_mtime = CostTracker.default_storage_path().stat().st_mtime_ns
+    except OSError:
+        usage_mtime = -1
+    return [repr(budget), usage_mtime, date.today().isoformat()]
+
+
+def _load_status_snapshot(key: list) -> Optional[Dict[str, Any]]:
+    """Return the cached status dict if it is fresh and was built for ``key``."""
+
+    try:
+        data = json.loads(_status_snapshot_path().read_text(encoding="utf-8"))
+        if data["key"] == key and 0 <= time.time() - data["cached_at"] < _STATUS_SNAPSHOT_TTL:
+            status: Dict[str, Any] = data["status"]
+            return status
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _save_status_snapshot(key: list, status: Dict[str, Any]) -> None:
+    path = _status_snapshot_path()
+    payload = json.dumps({"key": key, "cached_at": time.time(), "status": status}, default=str)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_text_atomic(path, payload, mode=0o600)
+    except OSError as exc:
+        logger.debug("Could not write budget status snapshot: %s", exc)
+
+
 @config_group.group(name="budget")
 def budget_group() -> None:
     """Budget monitoring commands."""
 
 
 @budget_group.command(name='status')
+@click.option('--no-cache', is_flag=True, help='Always recompute the status instead of reusing a fresh snapshot.')
 @click.pass_context
-def budget_status(ctx: click.Context) -> None:
+def budget_status(ctx: click.Context, no_cache: bool) -> None:
     """Show the current budget usage summary."""
 
     config_manager = _get_config_manager(ctx)
     config = config_manager.get_config()
 
-    budget_config = config.budget if isinstance(config.budget, BudgetConfig) else None
-    if budget_config is None:
-        # Try to create a default BudgetConfig if possible
-        try:
-            budget_config = BudgetConfig()
-        except Exception:
-            abort_with_error(
-                "Invalid budget configuration",
-                "The 'budget' section of your configuration is missing or malformed, and defaults could not be loaded.",
-                help_text="Please check your configuration file and ensure the 'budget' section is correctly specified.",
-                tip="Run 'evogitctl config setup' to regenerate a fresh configuration.",
-            )
-
-    guard = CostGuard(budget_config)
-    status = guard.get_status()
-
     formatter.print_header("Solo Git Budget Status")
 
-    if not isinstance(config.budget, BudgetConfig):
-        abort_with_error(
-            "Invalid budget configuration",
-            "The 'budget' section of your configuration is missing or malformed.",
-            help_text="Please check your configuration file and ensure the 'budget' section is correctly specified.",
-            tip="Run 'evogitctl config setup' to regenerate a fresh configuration.",
-        )
+    snapshot_key = None
+    if not no_cache and "cost_guard" not in _ensure_context(ctx):
+        snapshot_key = _status_snapshot_key(config.budget)
+    status = _load_status_snapshot(snapshot_key) if snapshot_key else None
+    if status is None:
+        status = _get_cost_guard(ctx, config.budget).get_status()
+        if snapshot_key:
+            _save_status_snapshot(snapshot_key, status)
 
-    guard = CostGuard(config.budget)
-    status = guard.get_status()
     summary_table = formatter.table(headers=["Metric", "Value"])
-    summary_table.add_row("Daily Cap", f"${status['daily_cap']:.2f}")
-    summary_table.add_row("Used Today", f"${status['current_cost']:.2f}")
-    summary_table.add_row("Remaining", f"${status['remaining']:.2f}")
+    summary_table.add_row("Daily Cap", _format_currency(status.get("daily_cap")))
+    summary_table.add_row("Used Today", _format_currency(status.get("current_cost")))
+    summary_table.add_row("Remaining", _format_currency(status.get("remaining")))
     summary_table.add_row("Usage", f"{status['percentage_used']:.1f}%")
-    budget_icon = theme.icons.success if status['within_budget'] else theme.icons.warning
-    budget_color = theme.colors.success if status['within_budget'] else theme.colors.warning
-    summary_table.add_row("Within Budget", f"[{budget_color}]{budget_icon} {'Yes' if status['within_budget'] else 'Check alerts'}[/{budget_color}]")
-    formatter.console.print(summary_table)
-
-    formatter.print_info(f"Daily Cap:       ${status['daily_cap']:.2f}")
-    formatter.print_info(f"Used Today:     ${status['current_cost']:.2f}")
-    formatter.print_info(f"Remaining:      ${status['remaining']:.2f}")
-    formatter.print_info(f"Usage:          {status['percentage_used']:.1f}%")
-
-    alerts = status.get("alerts")
-    if alerts:
-        alerts_panel = "\n".join(
-            f"[{theme.colors.warning}]{alert['timestamp']}[/] {alert['level'].upper()}: {alert['message']}"
-            for alert in alerts
+    colors, icons = theme.colors, theme.icons
+    within_budget = status.get("within_budget", True)
+    budget_icon = icons.success if within_budget else icons.warning
+    budget_color = colors.success if within_budget else colors.warning
+    summary_table.add_row("Within Budget", f"[{budget_color}]{budget_icon} {'Yes' if within_budget else 'Check alerts'}[/{budget_color}]")
+
+    # Collect every section and render them in a single console pass.
+    renderables: List[Any] = [summary_table]
+    info_title = f"{icons.info} {{}}"
+
     if status.get('alerts'):
+        warning_color = colors.warning
         alerts_panel = "\n".join(
-            f"[{theme.colors.warning}]{alert['timestamp']}[/] {alert['level'].upper()}: {alert['message']}"
+            f"[{warning_color}]{alert['timestamp']}[/] {alert['level'].upper()}: {alert['message']}"
             for alert in status['alerts']
         )
-        formatter.print_warning("Budget alerts detected.")
-        formatter.print_info_panel(alerts_panel, title="Alerts")
+        renderables.append(f"[{warning_color}]{icons.warning}[/{warning_color}] Budget alerts detected.")
+        renderables.append(formatter.panel(alerts_panel, title=info_title.format("Alerts")))
 
     breakdown: Dict[str, Any] = status.get("usage_breakdown") or {}
     if breakdown:
@@ -393,14 +561,14 @@ def budget_status(ctx: click.Context) -> None:
             "Total Tokens",
             f"{breakdown.get('total_tokens', 0)} in {breakdown.get('calls_count', 0)} calls"
         )
-        if breakdown.get('by_model'):
-            model_lines = [f"{model}: ${cost:.4f}" for model, cost in breakdown['by_model'].items()]
-            breakdown_table.add_row("By Model", "\n".join(model_lines))
-        if breakdown.get('by_task'):
-            task_lines = [f"{task}: ${cost:.4f}" for task, cost in breakdown['by_task'].items()]
-            breakdown_table.add_row("By Task", "\n".join(task_lines))
-        formatter.print_info_panel("Usage breakdown", title="Detailed Usage")
-        formatter.console.print(breakdown_table)
+        by_model = breakdown.get('by_model')
+        if by_model:
+            breakdown_table.add_row("By Model", "\n".join(f"{model}: ${cost:.4f}" for model, cost in by_model.items()))
+        by_task = breakdown.get('by_task')
+        if by_task:
+            breakdown_table.add_row("By Task", "\n".join(f"{task}: ${cost:.4f}" for task, cost in by_task.items()))
+        renderables.append(formatter.panel("Usage breakdown", title=info_title.format("Detailed Usage")))
+        renderables.append(breakdown_table)
 
     last_usage = cast(Optional[Dict[str, Any]], status.get("last_usage"))
     if last_usage:
@@ -410,42 +578,31 @@ def budget_status(ctx: click.Context) -> None:
             f"Cost: ${last_usage['cost_usd']:.4f}\n"
             f"Tokens: {last_usage['total_tokens']}"
         )
-        formatter.print_info_panel(last_panel, title="Most Recent Usage")
-
-
-    within_budget = status.get("within_budget", True)
-    icon = theme.icons.success if within_budget else theme.icons.warning
-    color = theme.colors.success if within_budget else theme.colors.warning
+        renderables.append(formatter.panel(last_panel, title=info_title.format("Most Recent Usage")))
 
-    formatter.console.print(
-        f"[{color}]{icon}[/{color}] Budget status: {'Within budget' if within_budget else 'Over budget'}"
+    renderables.append(
+        f"[{budget_color}]{budget_icon}[/{budget_color}] Budget status: {'Within budget' if within_budget else 'Over budget'}"
     )
-    formatter.console.print(f"Daily Cap:      {_format_currency(status.get('daily_cap'))}")
-    formatter.console.print(f"Used Today:     {_format_currency(status.get('current_cost'))}")
-    formatter.console.print(f"Remaining:      {_format_currency(status.get('remaining'))}")
-    formatter.console.print(f"Usage:          {status.get('percentage_used', 0)}%")
+    formatter.console.print(Group(*renderables))
 
 
 @config_group.command(name="init")
 @click.option("--force", is_flag=True, help="Overwrite existing configuration file")
 def init_config(force: bool) -> None:
     """Create a default configuration file."""
+    from sologit.config.templates import DEFAULT_CONFIG_TEMPLATE
 
     target_path = Path(ConfigManager.DEFAULT_CONFIG_FILE).expanduser()
-    if target_path.exists() and not force:
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # The config holds API credentials, so keep it private to the user.
+        _write_text_atomic(target_path, DEFAULT_CONFIG_TEMPLATE, mode=0o600, exclusive=not force)
+    except FileExistsError:
         formatter.print_warning("Configuration file already exists. Use --force to overwrite.")
         return
 
-    target_path.parent.mkdir(parents=True, exist_ok=True)
-    target_path.write_text(DEFAULT_CONFIG_TEMPLATE)
-    formatter.print_success("Created configuration file at %s" % target_path)
-
-    # Write template
-    with open(config_path, 'w') as f:
-        f.write(DEFAULT_CONFIG_TEMPLATE)
-
     formatter.print_success_panel(
-        f"Created configuration file at [bold]{config_path}[/bold]",
+        f"Created configuration file at [bold]{target_path}[/bold]",
         title="Config Initialized"
     )
     formatter.print_info("Edit the file to add your API credentials or run: evogitctl config setup")
@@ -453,33 +610,24 @@ def init_config(force: bool) -> None:
 
 @config_group.command(name="env-template")
 def env_template() -> None:
-    """Generate .env template file."""
+    """Generate a .env.example file with required variables."""
+    from sologit.config.templates import ENV_TEMPLATE
 
     env_path = Path.cwd() / ".env.example"
     if env_path.exists():
         formatter.print_warning(f"{env_path} already exists; overwriting.")
-    env_path.write_text(ENV_TEMPLATE.rstrip() + "\n", encoding="utf-8")
-    formatter.print_success(f"Wrote environment template to {env_path}")
+    _write_text_atomic(env_path, ENV_TEMPLATE.rstrip() + "\n")
+    formatter.print_success(f"Created {env_path.name}")
 
-@config_group.command(name='env-template')
-def env_template() -> None:
-    """Generate .env template file."""
-    env_path = Path.cwd() / '.env.example'
-    formatter.print_success(f"Created configuration file at {config_path}")
 
 @config_group.command(name="path")
 def config_path() -> None:
     """Print the resolved path to the configuration file."""
 
-    config_path = Path(ConfigManager.DEFAULT_CONFIG_FILE).expanduser()
-    formatter.print_info(f"Configuration file: {config_path}")
     target_path = Path(ConfigManager.DEFAULT_CONFIG_FILE).expanduser()
-    formatter.print_info(str(target_path))
-
-
-@config_group.command(name="env-template")
-def config_env_template() -> None:
-    """Generate a .env.example file with required variables."""
-    env_path = Path(".env.example")
-    env_path.write_text(ENV_TEMPLATE)
-    formatter.print_success("Created .env.example")
+    if not formatter.console.is_terminal:
+        # Piped or captured (e.g. ``$(evogitctl config path)``): emit only the
+        # bare path, unwrapped and undecorated.
+        click.echo(str(target_path))
+        return
+    formatter.print_info(f"Configuration file: {target_path}")
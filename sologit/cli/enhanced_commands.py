@@ -6,19 +6,25 @@ from pathlib import Path
 from typing import Optional
 from datetime import datetime
 import uuid
-from typing import Callable, Optional, TypeVar
+from typing import Callable, Dict, Optional, TypeVar
 
 import click
+from git import Repo
 
 from sologit.engines.git_engine import GitEngine, GitEngineError
 from sologit.engines.patch_engine import PatchEngine
 from sologit.engines.test_orchestrator import TestOrchestrator
 from sologit.state.manager import StateManager
+from sologit.state.schema import CommitNode
 from sologit.ui.formatter import RichFormatter
+from sologit.ui.graph import CommitGraphRenderer
 from sologit.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# One ``git log -z`` record per commit: sha, author, commit time, parents, message.
+_HISTORY_FORMAT = "%H%x1f%an%x1f%ct%x1f%P%x1f%B"
+
 
 class EnhancedCLI:
     """Enhanced CLI with Rich formatting and state management helpers."""
@@ -29,6 +35,8 @@ class EnhancedCLI:
         self._git_engine: Optional[GitEngine] = None
         self._patch_engine: Optional[PatchEngine] = None
         self._test_orchestrator: Optional[TestOrchestrator] = None
+        self._graph_renderer: Optional[CommitGraphRenderer] = None
+        self._status_cells: Dict[str, str] = {}
 
     @property
     def git_engine(self) -> GitEngine:
@@ -42,6 +50,22 @@ class EnhancedCLI:
             self._patch_engine = PatchEngine(self.git_engine)
         return self._patch_engine
 
+    @property
+    def graph_renderer(self) -> CommitGraphRenderer:
+        if self._graph_renderer is None:
+            self._graph_renderer = CommitGraphRenderer(self.formatter.console)
+        return self._graph_renderer
+
+    def _status_cell(self, status: str) -> str:
+        """Return the styled status cell for a workpad table, built once per status."""
+        cell = self._status_cells.get(status)
+        if cell is None:
+            theme = self.formatter.theme_obj
+            color = theme.get_status_color(status)
+            cell = f"[{color}]{theme.get_status_icon(status)} {status}[/{color}]"
+            self._status_cells[status] = cell
+        return cell
+
     @property
     def test_orchestrator(self) -> TestOrchestrator:
         if self._test_orchestrator is None:
@@ -49,84 +73,32 @@ class EnhancedCLI:
         return self._test_orchestrator
     
     # Repository Commands
-    
-    def repo_init(self, zip_file: Optional[str] = None, git_url: Optional[str] = None, 
-                  name: Optional[str] = None) -> None:
-        """Initialize a new repository."""
-        with self.formatter.create_progress() as progress:
-            task = progress.add_task("[cyan]Initializing repository...", total=100)
-            
-            try:
-                if zip_file:
-                    zip_path = Path(zip_file)
-                    zip_data = zip_path.read_bytes()
-                    if not name:
-                        name = zip_path.stem
-                    
-                    progress.update(task, advance=30, description="[cyan]Extracting zip...")
-                    repo_id = self.git_engine.init_from_zip(zip_data, name)
-                    
-                else:  # git_url
-                    if not name:
-                        name = Path(git_url).stem.replace('.git', '')
-                    
-                    progress.update(task, advance=30, description="[cyan]Cloning repository...")
-                    repo_id = self.git_engine.init_from_git(git_url, name)
-                
-                progress.update(task, advance=40, description="[cyan]Initializing state...")
-                
-                # Get repo info
-                repo = self.git_engine.get_repo(repo_id)
-                
-                # Create state entry
-                self.state_manager.create_repository(
-                    repo_id=repo.id,
-                    name=repo.name,
-                    path=str(repo.path)
-                )
-                
-                # Set as active
-                self.state_manager.set_active_context(repo_id=repo.id)
-                
-                # Get initial commits
-                try:
-                    import git
-                    git_repo = git.Repo(repo.path)
-                    for i, commit in enumerate(list(git_repo.iter_commits())[:20]):
-                        commit_node = CommitNode(
-                            sha=commit.hexsha,
-                            short_sha=commit.hexsha[:8],
-                            message=commit.message,
-                            author=commit.author.name,
-                            timestamp=datetime.fromtimestamp(commit.committed_date).isoformat(),
-                            parent_sha=commit.parents[0].hexsha if commit.parents else None,
-                            is_trunk=True
-                        )
-                        self.state_manager.add_commit(repo.id, commit_node)
-                except Exception as e:
-                    logger.warning(f"Could not load commit history: {e}")
-                
-                progress.update(task, advance=30, description="[green]Complete!")
-            
-            except GitEngineError as e:
-                progress.stop()
-                self.formatter.print_error(f"Failed to initialize repository: {e}")
-                raise click.Abort()
-        
-        # Print success summary
-        self.formatter.print_success("Repository initialized successfully!")
-        
-        content = f"""[bold]Repository ID:[/bold] {repo.id}
-[bold]Name:[/bold] {repo.name}
-[bold]Path:[/bold] {repo.path}
-[bold]Trunk Branch:[/bold] {repo.trunk_branch}"""
-        
-        self.formatter.print_panel(content, title="Repository Details")
-        
-        self.formatter.print_info("\nNext steps:")
-        self.formatter.console.print("  1. Create a workpad: [cyan]evogitctl pad create \"<title>\"[/cyan]")
-        self.formatter.console.print("  2. Or start AI pairing: [cyan]evogitctl pair \"<task>\"[/cyan]")
-    
+
+    def _load_initial_commit_history(self, repo_id: str, repo_path, limit: int = 20) -> None:
+        """Record the newest ``limit`` trunk commits of a repository in the state store.
+
+        A single ``git log -z`` call returns every field needed, so no GitPython
+        commit objects (and their per-attribute object reads) are created.
+        """
+        try:
+            output = Repo(repo_path).git.log(f"--format={_HISTORY_FORMAT}", "-z", "-n", str(limit))
+            commit_nodes = []
+            for record in output.split("\x00"):
+                if not record:
+                    continue
+                sha, author, committed, parents, message = record.split("\x1f", 4)
+                commit_nodes.append(CommitNode(
+                    sha=sha,
+                    short_sha=sha[:8],
+                    message=message,
+                    author=author,
+                    timestamp=datetime.fromtimestamp(int(committed)).isoformat(),
+                    parent_sha=parents.split(" ", 1)[0] if parents else None,
+                    is_trunk=True
+                ))
+            self.state_manager.add_commits(repo_id, commit_nodes)
+        except Exception as e:
+            logger.warning(f"Could not load commit history: {e}")
 
     def _run_stage(self, description: str, operation: Callable[[], StageResult]) -> StageResult:
         """Run a stage while emitting progress output."""
@@ -142,8 +114,11 @@ class EnhancedCLI:
     ) -> None:
         """Initialize a new repository with simple progress output."""
 
+        git_url = git_url.strip() if git_url else None
         if not zip_file and not git_url:
             raise click.BadParameter("Provide either zip_file or git_url")
+        if zip_file and not Path(zip_file).is_file():
+            raise click.BadParameter(f"Zip file not found: {zip_file}")
 
         self.formatter.print_header("Enhanced Repository Initialization")
         repo_id: Optional[str] = None
@@ -162,8 +137,6 @@ class EnhancedCLI:
                     lambda: self.git_engine.init_from_zip(archive_bytes, name),
                 )
             else:
-                if not git_url:
-                    raise click.BadParameter("git_url is required when no zip file is provided")
                 if not name:
                     base = git_url.rstrip("/").split("/")[-1]
                     if base.endswith(".git"):
@@ -231,32 +204,32 @@ class EnhancedCLI:
         
         self.formatter.print_panel(content, title=f"Repository: {repo.name}")
         
-        # Show commit graph
+        # Show commit graph; history is only read from git the first time it is shown
         commits = self.state_manager.get_commits(repo_id, limit=10)
+        if not commits:
+            self._load_initial_commit_history(repo_id, repo.path, limit=10)
+            commits = self.state_manager.get_commits(repo_id, limit=10)
         if commits:
             self.formatter.print("\n")
             self.formatter.print_header("Recent Commits")
             self.graph_renderer.render_graph(commits, max_lines=10)
         
         # Show active workpads
-        workpads = self.state_manager.list_workpads(repo_id)
-        active_workpads = [w for w in workpads if w.status in ['active', 'testing']]
+        active_workpads = self.state_manager.list_workpads(repo_id, status_in=('active', 'testing'))
         
         if active_workpads:
             self.formatter.print("\n")
             self.formatter.print_header(f"Active Workpads ({len(active_workpads)})")
             
             table = self.formatter.table(headers=["ID", "Title", "Status", "Tests", "Created"])
+            add_row, status_cell, fmt_ts = table.add_row, self._status_cell, self.formatter.format_timestamp
             for wp in active_workpads[:5]:
-                status_icon = self.formatter.theme_obj.get_status_icon(wp.status)
-                status_color = self.formatter.theme_obj.get_status_color(wp.status)
-                
-                table.add_row(
+                add_row(
                     wp.workpad_id[:8],
                     wp.title,
-                    f"[{status_color}]{status_icon} {wp.status}[/{status_color}]",
+                    status_cell(wp.status),
                     str(len(wp.test_runs)),
-                    self.formatter.format_timestamp(wp.created_at)
+                    fmt_ts(wp.created_at)
                 )
             
             self.formatter.console.print(table)
@@ -318,14 +291,16 @@ class EnhancedCLI:
         self.formatter.print_panel(content, title="Workpad Details")
         
         self.formatter.print_info("\nNext steps:")
-        self.formatter.console.print("  1. Apply patches: [cyan]evogitctl pad apply-patch[/cyan]")
-        self.formatter.console.print("  2. Run tests: [cyan]evogitctl test run[/cyan]")
-        self.formatter.console.print("  3. Or use AI: [cyan]evogitctl pair \"<task>\"[/cyan]")
+        self.formatter.console.print(
+            "  1. Apply patches: [cyan]evogitctl pad apply-patch[/cyan]\n"
+            "  2. Run tests: [cyan]evogitctl test run[/cyan]\n"
+            "  3. Or use AI: [cyan]evogitctl pair \"<task>\"[/cyan]"
+        )
     
     def pad_list(self, repo_id: Optional[str] = None) -> None:
         """List workpads."""
+        context = self.state_manager.get_active_context()
         if not repo_id:
-            context = self.state_manager.get_active_context()
             repo_id = context['repo_id']
         
         workpads = self.state_manager.list_workpads(repo_id)
@@ -340,7 +315,8 @@ class EnhancedCLI:
             headers=["ID", "Title", "Status", "Branch", "Patches", "Tests", "Created"]
         )
         
-        active_workpad = self.state_manager.get_active_context()['workpad_id']
+        active_workpad = context['workpad_id']
+        add_row, status_cell, fmt_ts = table.add_row, self._status_cell, self.formatter.format_timestamp
         
         for wp in workpads[:20]:  # Limit display
             is_active = wp.workpad_id == active_workpad
@@ -348,17 +324,14 @@ class EnhancedCLI:
             if is_active:
                 wp_id_display += " *"
             
-            status_icon = self.formatter.theme_obj.get_status_icon(wp.status)
-            status_color = self.formatter.theme_obj.get_status_color(wp.status)
-            
-            table.add_row(
+            add_row(
                 wp_id_display,
                 wp.title[:30],
-                f"[{status_color}]{status_icon} {wp.status}[/{status_color}]",
+                status_cell(wp.status),
                 wp.branch_name,
                 str(wp.patches_applied),
                 str(len(wp.test_runs)),
-                self.formatter.format_timestamp(wp.created_at)
+                fmt_ts(wp.created_at)
             )
         
         self.formatter.console.print(table)
@@ -384,6 +357,3 @@ class EnhancedCLI:
         diff_text = self.git_engine.get_diff(pad_id)
         self.formatter.print_header(f"Diff for {workpad.title}")
         self.formatter.console.print(diff_text)
-
-
-enhanced_cli = EnhancedCLI()
@@ -227,10 +227,7 @@ def hello():
 
 
 @cli.command()
-def shortcuts():
-    """Show keyboard shortcuts reference."""
-@click.option("--dev", is_flag=True, help="Launch in development mode")
-def shortcuts(dev: bool = False) -> None:
+def shortcuts() -> None:
     """Display keyboard shortcuts for the Heaven Interface TUI."""
 
     formatter.print_header("Heaven Interface Keyboard Shortcuts")
@@ -451,6 +448,31 @@ def interactive():
         raise click.Abort()
 
 
+@cli.command()
+@click.option(
+    '--input', 'source', type=click.File('r'), default='-',
+    help='Read commands from a file or named pipe instead of stdin'
+)
+@click.pass_context
+def repl(ctx, source):
+    """
+    Run commands from stdin in a single long-lived process.
+
+    Each line is parsed like a shell command line and dispatched through
+    the evogitctl command group. Interpreter start-up, imports and the
+    module-level engines are paid for once per batch; each command still
+    loads the configuration afresh, so edits made by earlier lines apply:
+
+        printf 'pad create a\\npad create b\\n' | evogitctl repl
+
+    Blank lines and lines starting with '#' are skipped; 'exit' or 'quit'
+    ends the session. Commands run sequentially on the main thread, so
+    commands using asyncio.run (such as 'test run') behave as they do
+    when invoked directly.
+    """
+    ctx.exit(_run_batch_session(source))
+
+
 @cli.command()
 def undo():
     """Undo the last undoable command."""
@@ -720,6 +742,54 @@ def _run_interactive_shell() -> int:
             formatter.print_warning(f"Command exited with code {exit_code}")
 
 
+_BATCH_NESTED_COMMANDS = frozenset({"repl", "interactive"})
+
+
+def _run_batch_session(stream) -> int:
+    """Dispatch newline-separated commands from ``stream`` until EOF.
+
+    Returns 0 when every command succeeded, otherwise 1. Failing commands are
+    reported and the session moves on to the next line.
+    """
+    failures = 0
+
+    for line_number, line in enumerate(iter(stream.readline, ""), start=1):
+        command = line.strip()
+        if not command or command.startswith("#"):
+            continue
+        if command.lower() in {"exit", "quit"}:
+            break
+
+        try:
+            args = shlex.split(command)
+        except ValueError as exc:
+            formatter.print_warning(f"Line {line_number}: could not parse command ({exc})")
+            failures += 1
+            continue
+
+        if args[0] in _BATCH_NESTED_COMMANDS:
+            formatter.print_warning(f"Line {line_number}: '{args[0]}' cannot be nested inside repl")
+            failures += 1
+            continue
+
+        try:
+            exit_code = _execute_cli_command(args, command_text=command)
+        except (click.Abort, click.ClickException) as exc:
+            if isinstance(exc, click.ClickException):
+                exc.show()
+            exit_code = 1
+        except Exception as exc:
+            logger.exception("Command failed in repl: %s", command)
+            formatter.print_warning(f"Line {line_number}: {exc}")
+            exit_code = 1
+
+        if exit_code != 0:
+            failures += 1
+            formatter.print_warning(f"Line {line_number}: command exited with code {exit_code}")
+
+    return 1 if failures else 0
+
+
 def _execute_cli_command(
     argv: List[str],
     *,
@@ -6,6 +6,7 @@ controls, deployment credentials, and test configurations.
 """
 
 import base64
+import functools
 import hashlib
 import os
 from dataclasses import dataclass, asdict
@@ -25,6 +26,20 @@ except Exception:  # pragma: no cover - cryptography is optional
     Fernet = None  # type: ignore
     InvalidToken = Exception  # type: ignore
 
+# Prefer libyaml's C loader when PyYAML was built with it; same safe semantics.
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_MASK_PREFIX, _MASK_SUFFIX = 8, 4
+
+
+@functools.lru_cache(maxsize=8)
+def _mask_api_key(api_key: str) -> str:
+    """Mask an API key for display; keys too short to truncate are hidden entirely."""
+    # Only show a prefix and suffix when at least one character stays hidden.
+    if len(api_key) <= _MASK_PREFIX + _MASK_SUFFIX:
+        return "***"
+    return f"{api_key[:_MASK_PREFIX]}...{api_key[-_MASK_SUFFIX:]}"
+
 
 @dataclass
 class AbacusAPIConfig:
@@ -37,6 +52,11 @@ class AbacusAPIConfig:
         """Check if API credentials are configured."""
         return bool(self.api_key)
 
+    @property
+    def masked_key(self) -> str:
+        """API key safe for display, or an empty string when unset."""
+        return _mask_api_key(self.api_key) if self.api_key else ""
+
 
 @dataclass
 class ModelVariantConfig:
@@ -481,8 +501,10 @@ class ConfigManager:
 
         Args:
             config_path: Optional path to config file. If None, uses default location.
+
+        ``config_path`` is always set, so callers can read it directly.
         """
-        self.config_path = config_path or self.DEFAULT_CONFIG_FILE
+        self.config_path: Path = config_path or self.DEFAULT_CONFIG_FILE
         self._fernet = self._build_fernet()
         self.config = self._load_config()
 
@@ -502,7 +524,7 @@ class ConfigManager:
         if self.config_path.exists():
             try:
                 with open(self.config_path, 'r') as f:
-                    file_config = yaml.safe_load(f)
+                    file_config = yaml.load(f, Loader=_YamlSafeLoader)
                     if file_config:
                         config = self._merge_config(config, file_config)
                         logger.info("Loaded configuration from %s", self.config_path)
@@ -873,9 +873,9 @@ class GitEngine:
                 }
                 files_changed.append(stats)
 
-            # Get commit count
-            commits = list(repo.iter_commits(
-                f"{repository.trunk_branch}..{workpad.branch_name}"
+            # Let git count the commits; no Commit objects are built
+            commits_ahead = int(repo.git.rev_list(
+                "--count", f"{repository.trunk_branch}..{workpad.branch_name}"
             ))
 
             return {
@@ -883,7 +883,7 @@ class GitEngine:
                 'title': workpad.title,
                 'files_changed': len(files_changed),
                 'files_details': files_changed,
-                'commits_ahead': len(commits),
+                'commits_ahead': commits_ahead,
                 'checkpoints': len(workpad.checkpoints),
                 'status': workpad.status,
                 'test_status': workpad.test_status,
@@ -1119,19 +1119,19 @@ class GitEngine:
             pad_commit = getattr(repo.heads, workpad.branch_name).commit
             
             # Commits in workpad but not in trunk (ahead)
-            ahead = list(repo.iter_commits(
-                f"{repository.trunk_branch}..{workpad.branch_name}"
+            ahead = int(repo.git.rev_list(
+                "--count", f"{repository.trunk_branch}..{workpad.branch_name}"
             ))
             
             # Commits in trunk but not in workpad (behind)
-            behind = list(repo.iter_commits(
-                f"{workpad.branch_name}..{repository.trunk_branch}"
+            behind = int(repo.git.rev_list(
+                "--count", f"{workpad.branch_name}..{repository.trunk_branch}"
             ))
             
             return {
-                'ahead': len(ahead),
-                'behind': len(behind),
-                'can_fast_forward': len(behind) == 0,
+                'ahead': ahead,
+                'behind': behind,
+                'can_fast_forward': behind == 0,
             }
             
         except Exception as e:
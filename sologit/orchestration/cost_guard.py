@@ -75,6 +75,11 @@ class CostTracker:
     Tracks AI API costs and usage statistics.
     """
     
+    @staticmethod
+    def default_storage_path() -> Path:
+        """Return the usage ledger location used when no path is given."""
+        return Path.home() / '.sologit' / 'usage.json'
+    
     def __init__(self, storage_path: Optional[Path] = None):
         """
         Initialize cost tracker.
@@ -82,7 +87,7 @@ class CostTracker:
         Args:
             storage_path: Path to store usage data
         """
-        self.storage_path = storage_path or Path.home() / '.sologit' / 'usage.json'
+        self.storage_path = storage_path or self.default_storage_path()
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         
         self.usage_history: Dict[date, DailyUsage] = {}
@@ -14,7 +14,7 @@ import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 from sologit.state.schema import (
     CommitNode,
@@ -80,8 +80,12 @@ class StateBackend(ABC):
         pass
 
     @abstractmethod
-    def list_workpads(self, repo_id: Optional[str] = None) -> List[WorkpadState]:
-        """List workpad states, optionally filtered by repository identifier."""
+    def list_workpads(
+        self,
+        repo_id: Optional[str] = None,
+        status_in: Optional[Iterable[str]] = None,
+    ) -> List[WorkpadState]:
+        """List workpad states, optionally filtered by repository identifier and status."""
         pass
 
     @abstractmethod
@@ -159,6 +163,11 @@ class StateBackend(ABC):
         """Persist a commit for the specified repository."""
         pass
 
+    def write_commits(self, repo_id: str, commits: List[CommitNode]) -> None:
+        """Persist several commits, ordered newest first, for the specified repository."""
+        for commit in reversed(commits):
+            self.write_commit(repo_id, commit)
+
     @abstractmethod
     def write_event(self, event: StateEvent) -> None:
         """Persist a state event."""
@@ -264,14 +273,22 @@ class JSONStateBackend(StateBackend):
         path = self.workpads_dir / f"{state.workpad_id}.json"
         self._write_json(path, state.to_dict())
     
-    def list_workpads(self, repo_id: Optional[str] = None) -> List[WorkpadState]:
+    def list_workpads(
+        self,
+        repo_id: Optional[str] = None,
+        status_in: Optional[Iterable[str]] = None,
+    ) -> List[WorkpadState]:
+        statuses = None if status_in is None else frozenset(status_in)
         workpads = []
         for path in self.workpads_dir.glob("*.json"):
             data = self._read_json(path)
-            if data:
-                workpad = WorkpadState.from_dict(data)
-                if repo_id is None or workpad.repo_id == repo_id:
-                    workpads.append(workpad)
+            if not data:
+                continue
+            if repo_id is not None and data.get("repo_id") != repo_id:
+                continue
+            if statuses is not None and data.get("status") not in statuses:
+                continue
+            workpads.append(WorkpadState.from_dict(data))
         return sorted(workpads, key=lambda w: w.created_at, reverse=True)
 
     def delete_workpad(self, workpad_id: str) -> None:
@@ -383,6 +400,14 @@ class JSONStateBackend(StateBackend):
         commits = commits[:1000]
         
         self._write_json(path, {"commits": commits, "repo_id": repo_id})
+
+    def write_commits(self, repo_id: str, commits: List[CommitNode]) -> None:
+        path = self.commits_dir / f"{repo_id}.json"
+        data = self._read_json(path, {"commits": []})
+
+        # One read and one write for the whole batch, newest first
+        merged = [commit.to_dict() for commit in commits] + data.get("commits", [])
+        self._write_json(path, {"commits": merged[:1000], "repo_id": repo_id})
     
     def write_event(self, event: StateEvent) -> None:
         # Append to daily event log
@@ -536,9 +561,13 @@ class StateManager:
             self._emit_event(EventType.WORKPAD_UPDATED, {"workpad_id": workpad_id})
         return state
     
-    def list_workpads(self, repo_id: Optional[str] = None) -> List[WorkpadState]:
-        """List workpads, optionally filtered by repository."""
-        return self.backend.list_workpads(repo_id)
+    def list_workpads(
+        self,
+        repo_id: Optional[str] = None,
+        status_in: Optional[Iterable[str]] = None,
+    ) -> List[WorkpadState]:
+        """List workpads, optionally filtered by repository and status."""
+        return self.backend.list_workpads(repo_id, status_in=status_in)
 
     def delete_workpad(self, workpad_id: str) -> None:
         """Delete workpad state and related records."""
@@ -729,6 +758,15 @@ class StateManager:
             "message": commit.message
         })
     
+    def add_commits(self, repo_id: str, commits: List[CommitNode]) -> None:
+        """Record existing history (ordered newest first) in a single backend write.
+
+        This imports commits rather than creating them, so no per-commit
+        ``COMMIT_CREATED`` events are emitted.
+        """
+        if commits:
+            self.backend.write_commits(repo_id, commits)
+
     def get_commits(self, repo_id: str, limit: int = 100) -> List[CommitNode]:
         """Get commit history for a repository."""
         return self.backend.read_commits(repo_id, limit)
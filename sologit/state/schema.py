@@ -11,6 +11,10 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Dict, Optional, Any
 import json
+import sys
+
+# Row-like records are listed in bulk; slots drop the per-instance __dict__ (3.10+).
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class WorkpadStatus(Enum):
@@ -42,7 +46,7 @@ class AIOperationStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CommitNode:
     """Represents a commit in the graph."""
     sha: str
@@ -83,7 +87,7 @@ class TestResult:
         return TestResult(**data)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TestRun:
     """A complete test run."""
     run_id: str
@@ -138,7 +142,7 @@ class PromotionRecord:
         return PromotionRecord(**data)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AIOperation:
     """An AI operation (planning, coding, etc.)."""
     operation_id: str
@@ -162,7 +166,7 @@ class AIOperation:
         return AIOperation(**data)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WorkpadState:
     """State of a workpad."""
     workpad_id: str
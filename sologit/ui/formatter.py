@@ -222,9 +222,10 @@ class RichFormatter:
 
     def print_bullet_list(self, items: Sequence[str], icon: str = "•", style: Optional[str] = None) -> None:
         """Print a bullet list."""
-        for item in items:
-            bullet = f"[{style}]{icon}[/{style}]" if style else icon
-            self.console.print(f"  {bullet} {item}")
+        if not items:
+            return
+        bullet = f"[{style}]{icon}[/{style}]" if style else icon
+        self.console.print("\n".join(f"  {bullet} {item}" for item in items))
     
     def table(self, title: Optional[str] = None, headers: Optional[List[str]] = None) -> Table:
         """Create a table with Heaven Interface styling."""
@@ -273,25 +274,6 @@ class RichFormatter:
         """Create a managed progress context with an initial indeterminate task."""
         return ProgressContext(self.create_progress(), description)
 
-
-class ProgressContext:
-    """Context manager that manages an indeterminate task for scoped progress."""
-
-    def __init__(self, progress: Progress, description: str):
-        self._progress = progress
-        self._description = description
-        self._task_id: Optional[int] = None
-
-    def __enter__(self) -> Progress:
-        progress = self._progress.__enter__()
-        self._task_id = progress.add_task(self._description, total=None)
-        return progress
-
-    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self._task_id is not None:
-            self._progress.remove_task(self._task_id)
-        self._progress.__exit__(exc_type, exc_val, exc_tb)
-    
     def tree(self, label: str) -> Tree:
         """Create a tree structure."""
         return Tree(
@@ -377,5 +359,24 @@ class ProgressContext:
         self.print_panel(content, title="AI Operation", border_color=color)
 
 
+class ProgressContext:
+    """Context manager that manages an indeterminate task for scoped progress."""
+
+    def __init__(self, progress: Progress, description: str):
+        self._progress = progress
+        self._description = description
+        self._task_id: Optional[int] = None
+
+    def __enter__(self) -> Progress:
+        progress = self._progress.__enter__()
+        self._task_id = progress.add_task(self._description, total=None)
+        return progress
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._task_id is not None:
+            self._progress.remove_task(self._task_id)
+        self._progress.__exit__(exc_type, exc_val, exc_tb)
+
+
 # Global formatter instance
 formatter = RichFormatter()
@@ -135,6 +135,23 @@ class Icons:
     hourglass: str = "⏳"
 
 
+# Status name -> palette/icon field; unknown statuses fall back in the getters.
+_STATUS_COLOR_FIELDS: Dict[str, str] = {
+    **dict.fromkeys(("passed", "success", "green", "ok"), "passed"),
+    **dict.fromkeys(("failed", "error", "red"), "failed"),
+    **dict.fromkeys(("pending", "waiting", "queued", "yellow"), "pending"),
+    **dict.fromkeys(("running", "active", "blue"), "running"),
+}
+
+_STATUS_ICON_FIELDS: Dict[str, str] = {
+    **dict.fromkeys(("passed", "success", "green", "ok"), "success"),
+    **dict.fromkeys(("failed", "error", "red"), "error"),
+    **dict.fromkeys(("pending", "waiting", "queued"), "pending"),
+    **dict.fromkeys(("running", "active"), "running"),
+    **dict.fromkeys(("warning", "warn"), "warning"),
+}
+
+
 class HeavenTheme:
     """
     Complete Heaven Interface theme.
@@ -151,33 +168,11 @@ class HeavenTheme:
     
     def get_status_color(self, status: str) -> str:
         """Get color for a status string."""
-        status_lower = status.lower()
-        if status_lower in ['passed', 'success', 'green', 'ok']:
-            return self.colors.passed
-        elif status_lower in ['failed', 'error', 'red']:
-            return self.colors.failed
-        elif status_lower in ['pending', 'waiting', 'queued', 'yellow']:
-            return self.colors.pending
-        elif status_lower in ['running', 'active', 'blue']:
-            return self.colors.running
-        else:
-            return self.colors.text_secondary
+        return getattr(self.colors, _STATUS_COLOR_FIELDS.get(status.lower(), "text_secondary"))
     
     def get_status_icon(self, status: str) -> str:
         """Get icon for a status string."""
-        status_lower = status.lower()
-        if status_lower in ['passed', 'success', 'green', 'ok']:
-            return self.icons.success
-        elif status_lower in ['failed', 'error', 'red']:
-            return self.icons.error
-        elif status_lower in ['pending', 'waiting', 'queued']:
-            return self.icons.pending
-        elif status_lower in ['running', 'active']:
-            return self.icons.running
-        elif status_lower in ['warning', 'warn']:
-            return self.icons.warning
-        else:
-            return self.icons.info
+        return getattr(self.icons, _STATUS_ICON_FIELDS.get(status.lower(), "info"))
 
 
 # Global theme instance
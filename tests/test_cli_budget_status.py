@@ -28,3 +28,58 @@ def test_budget_status_cli(monkeypatch):
 
         assert result.exit_code == 0
         assert "Solo Git Budget Status" in result.output
+
+
+def test_cost_guard_is_shared_per_context_only(monkeypatch, tmp_path):
+    """A guard is reused within one invocation but never outlives its context."""
+    import click
+
+    from sologit.cli import config_commands
+    from sologit.config.manager import BudgetConfig
+
+    monkeypatch.setenv('HOME', str(tmp_path))
+    budget = BudgetConfig(daily_usd_cap=5.0)
+    ctx = click.Context(config_commands.budget_status, obj={})
+
+    first = config_commands._get_cost_guard(ctx, budget)
+    assert config_commands._get_cost_guard(ctx, budget) is first
+    assert ctx.obj['cost_guard'] is first
+
+    # A failed budget check in another process records an alert but leaves the ledger alone
+    from sologit.orchestration.cost_guard import CostGuard
+
+    assert CostGuard(budget).check_budget(10.0) is False
+
+    fresh = config_commands._get_cost_guard(click.Context(config_commands.budget_status, obj={}), budget)
+    assert fresh is not first
+    assert [alert['level'] for alert in fresh.get_status()['alerts']] == ['exceeded']
+
+
+def test_budget_status_reuses_fresh_snapshot(monkeypatch, tmp_path):
+    """A second status call within the TTL renders the snapshot without CostGuard."""
+    from sologit.orchestration.cost_guard import CostGuard
+
+    monkeypatch.setenv('HOME', str(tmp_path))
+    config_path = tmp_path / '.sologit' / 'config.yaml'
+    ConfigManager(config_path=config_path).save_config()
+
+    calls = []
+    original = CostGuard.get_status
+
+    def counting_get_status(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(CostGuard, 'get_status', counting_get_status)
+    runner = CliRunner()
+    args = ['--config', str(config_path), 'config', 'budget', 'status']
+
+    assert runner.invoke(cli, args).exit_code == 0
+    assert runner.invoke(cli, args).exit_code == 0
+    assert len(calls) == 1
+    assert (tmp_path / '.sologit' / 'cli_budget_status.json').stat().st_mode & 0o777 == 0o600
+
+    result = runner.invoke(cli, args + ['--no-cache'])
+    assert result.exit_code == 0
+    assert "Used Today" in result.output
+    assert len(calls) == 2
@@ -1,4 +1,3 @@
-
 """Tests for the CLI commands."""
 import pytest
 from click.testing import CliRunner
@@ -8,6 +7,7 @@ from sologit.engines.git_engine import GitEngineError
 from sologit.engines.test_orchestrator import TestStatus, TestResult, TestExecutionMode
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 
 
 @pytest.fixture
@@ -17,6 +17,8 @@ def mock_git_engine():
         mock_engine = MagicMock()
         mock_get.return_value = mock_engine
         yield mock_engine
+
+
 @pytest.fixture
 def mock_git_sync():
     """Fixture for a mocked GitStateSync."""
@@ -39,6 +41,16 @@ def mock_test_orchestrator():
         yield mock_orchestrator
 
 
+@pytest.fixture
+def mock_state_manager():
+    """Fixture for a mocked StateManager."""
+    with patch('sologit.cli.commands.StateManager') as mock_cls:
+        mock_manager = MagicMock()
+        mock_manager.create_test_run.return_value = SimpleNamespace(run_id="run-1")
+        mock_cls.return_value = mock_manager
+        yield mock_manager
+
+
 def test_repo_list_no_repos(mock_git_engine):
     """Test `repo list` with no repositories."""
     mock_git_engine.list_repos.return_value = []
@@ -131,6 +143,20 @@ def test_repo_info_not_found(mock_git_engine):
     assert "Suggested Commands" in result.output
 
 
+def test_repo_list_string_timestamps(mock_git_engine):
+    """Non-datetime timestamps are rendered as plain strings."""
+    repo_obj = SimpleNamespace(
+        id="repo1", name="my-app", trunk_branch="main", workpad_count=1, created_at="2023-01-01T10:00:00"
+    )
+    mock_git_engine.list_repos.return_value = [repo_obj]
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['repo', 'list'], terminal_width=200)
+
+    assert result.exit_code == 0, result.output
+    assert "2023-01-01T10:00:00" in result.output
+
+
 def test_repo_init_from_zip(mock_git_sync, tmp_path):
     """Test `repo init` from a zip file."""
     zip_file = tmp_path / "test.zip"
@@ -182,6 +208,24 @@ def test_repo_init_from_git(mock_git_sync):
     mock_git_sync.init_repo_from_git.assert_called_once_with(git_url, "repo")
 
 
+def test_repo_init_from_git_derives_name_without_suffix(mock_git_sync):
+    """Repository names come from the URL basename with only the .git suffix removed."""
+    mock_git_sync.init_repo_from_git.return_value = {
+        'repo_id': 'git_repo',
+        'name': 'my.project',
+        'path': '/path/to/git_repo',
+        'trunk_branch': 'main',
+    }
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['repo', 'init', '--git', 'git@example.com:team/my.project.git/'])
+
+    assert result.exit_code == 0, result.output
+    mock_git_sync.init_repo_from_git.assert_called_once_with(
+        'git@example.com:team/my.project.git/', 'my.project'
+    )
+
+
 def test_repo_init_no_source(mock_git_engine):
     """Test `repo init` with no source provided."""
     runner = CliRunner()
@@ -356,6 +400,28 @@ def test_pad_list_with_pads(mock_git_engine):
     assert "pending" in result.output
     assert "❌ failed" in result.output
 
+
+def test_pad_list_reuses_status_badges(mock_git_engine, monkeypatch):
+    """Rows sharing a status render from one badge built on first use."""
+    from sologit.cli import commands
+
+    monkeypatch.setattr(commands, "_STATUS_BADGES", dict(commands._STATUS_BADGES))
+    built = []
+    original = commands._build_status_badge
+    monkeypatch.setattr(commands, "_build_status_badge", lambda status: built.append(status) or original(status))
+    mock_git_engine.list_workpads.return_value = [
+        SimpleNamespace(id=f"pad{index}_id_long", title=f"old-{index}", status="archived",
+                        checkpoints=[], test_status=None, created_at=datetime(2023, 1, index + 1))
+        for index in range(3)
+    ]
+
+    result = CliRunner().invoke(cli, ['pad', 'list'])
+
+    assert result.exit_code == 0, result.output
+    assert result.output.count("archived") == 3
+    assert built == ["archived"]
+
+
 def test_pad_info_found(mock_git_engine):
     """Test `pad info` for an existing workpad."""
     mock_pad = MagicMock()
@@ -466,7 +532,6 @@ def test_pad_promote_engine_error(mock_git_engine):
 
 
 def test_test_run_success(mock_git_engine, mock_test_orchestrator, mock_state_manager):
-def test_test_run_success(mock_git_engine, mock_test_orchestrator):
     """Test `test run` with successful test execution."""
     mock_pad = MagicMock()
     mock_pad.title = "test-pad"
@@ -486,6 +551,7 @@ def test_test_run_success(mock_git_engine, mock_test_orchestrator):
 
     assert result.exit_code == 0, result.output
     assert "Test Execution" in result.output
+    assert result.output.count("🧪 Test Execution") == 1
     assert "Workpad: test-pad" in result.output
     assert "✅ passed" in result.output
     assert "Test Summary" in result.output
@@ -493,7 +559,33 @@ def test_test_run_success(mock_git_engine, mock_test_orchestrator):
     mock_test_orchestrator.run_tests.assert_called_once()
 
 
-def test_test_run_failure(mock_git_engine, mock_test_orchestrator):
+def test_test_run_results_table_skips_overflow_handling(mock_git_engine, mock_test_orchestrator, mock_state_manager):
+    """Every column of the results table uses overflow="ignore"."""
+    from sologit.cli import commands
+
+    mock_git_engine.get_workpad.return_value = MagicMock(title="table-pad")
+    mock_test_orchestrator.run_tests.return_value = [
+        TestResult(name='unit-tests', status=TestStatus.PASSED, duration_ms=1, exit_code=0, stdout='', stderr='', mode='subprocess'),
+    ]
+    mock_test_orchestrator.get_summary.return_value = {
+        'total': 1, 'passed': 1, 'failed': 0, 'timeout': 0, 'skipped': 0, 'status': 'green'
+    }
+    tables = []
+    original = commands.formatter.table
+
+    def recording_table(*args, **kwargs):
+        tables.append(original(*args, **kwargs))
+        return tables[-1]
+
+    with patch.object(commands.formatter, 'table', recording_table):
+        result = CliRunner().invoke(cli, ['test', 'run', 'pad1'])
+
+    assert result.exit_code == 0, result.output
+    results_table = next(table for table in tables if table.columns[0].header == "Test")
+    assert {column.overflow for column in results_table.columns} == {"ignore"}
+
+
+def test_test_run_failure(mock_git_engine, mock_test_orchestrator, mock_state_manager):
     """Test `test run` with failed tests."""
     mock_pad = MagicMock()
     mock_pad.title = "failing-pad"
@@ -518,7 +610,56 @@ def test_test_run_failure(mock_git_engine, mock_test_orchestrator):
     assert "Passed: 1" in result.output
     assert "Failed: 1" in result.output
 
-def test_test_run_pad_not_found(mock_git_engine, mock_test_orchestrator):
+
+def test_test_run_truncates_long_notes(mock_git_engine, mock_test_orchestrator, mock_state_manager):
+    """Multi-line stderr should be collapsed and truncated in the results table."""
+    mock_pad = MagicMock()
+    mock_pad.title = "noisy-pad"
+    mock_git_engine.get_workpad.return_value = mock_pad
+
+    noisy_stderr = "line\n\n   trace\t" * 10_000
+    results = [
+        TestResult(name='unit-tests', status=TestStatus.FAILED, duration_ms=10, exit_code=1, stdout='', stderr=noisy_stderr, mode='subprocess'),
+    ]
+    mock_test_orchestrator.run_tests.return_value = results
+    mock_test_orchestrator.get_summary.return_value = {
+        'total': 1, 'passed': 0, 'failed': 1, 'timeout': 0, 'skipped': 0, 'status': 'red'
+    }
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['test', 'run', 'pad1'], terminal_width=300)
+
+    assert result.exit_code == 0, result.output
+    assert "line trace line trace" in result.output
+    assert "..." in result.output
+
+
+def test_test_run_records_combined_output(mock_git_engine, mock_test_orchestrator, mock_state_manager):
+    """Stored test output joins stdout and stderr, or reuses whichever one is present."""
+    mock_pad = MagicMock()
+    mock_pad.title = "output-pad"
+    mock_git_engine.get_workpad.return_value = mock_pad
+
+    results = [
+        TestResult(name='both', status=TestStatus.PASSED, duration_ms=1, exit_code=0, stdout='out', stderr='err', mode='subprocess'),
+        TestResult(name='stdout-only', status=TestStatus.PASSED, duration_ms=1, exit_code=0, stdout='out', stderr='', mode='subprocess'),
+        TestResult(name='stderr-only', status=TestStatus.PASSED, duration_ms=1, exit_code=0, stdout='', stderr='err', mode='subprocess'),
+        TestResult(name='silent', status=TestStatus.PASSED, duration_ms=1, exit_code=0, stdout='', stderr='', mode='subprocess'),
+    ]
+    mock_test_orchestrator.run_tests.return_value = results
+    mock_test_orchestrator.get_summary.return_value = {
+        'total': 4, 'passed': 4, 'failed': 0, 'timeout': 0, 'skipped': 0, 'status': 'green'
+    }
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['test', 'run', 'pad1'])
+
+    assert result.exit_code == 0, result.output
+    stored = mock_state_manager.update_test_run.call_args.kwargs['tests']
+    assert [entry.output for entry in stored] == ['out\nerr', 'out', 'err', '']
+
+
+def test_test_run_pad_not_found(mock_git_engine, mock_test_orchestrator, mock_state_manager):
     """Test `test run` for a non-existent workpad."""
     mock_git_engine.get_workpad.return_value = None
     runner = CliRunner()
@@ -568,3 +709,29 @@ def test_test_run_exception_handler(mock_git_engine, mock_test_orchestrator, moc
     assert "Workpad: pad123" in result.output
     assert "Unexpected test failure" in result.output
     assert "evogitctl test run pad123" in result.output
+
+
+def test_pad_auto_merge_no_auto_promote_skips_ci_setup(mock_git_engine, mock_test_orchestrator, mock_state_manager):
+    """With promotion disabled the CI orchestrator and rollback handler are not built."""
+    mock_pad = MagicMock()
+    mock_pad.title = "pad"
+    mock_pad.id = "pad-12345678"
+    mock_git_engine.get_workpad.return_value = mock_pad
+
+    with patch('sologit.workflows.auto_merge.AutoMergeWorkflow') as mock_workflow_cls, \
+            patch('sologit.workflows.ci_orchestrator.CIOrchestrator') as mock_ci_cls, \
+            patch('sologit.workflows.rollback_handler.RollbackHandler') as mock_rollback_cls:
+        mock_workflow = mock_workflow_cls.return_value
+        mock_workflow.execute.return_value = MagicMock(success=True)
+        mock_workflow.format_result.return_value = "done"
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ['pad', 'auto-merge', 'pad1', '--no-auto-promote'])
+
+    assert result.exit_code == 0, result.output
+    mock_ci_cls.assert_not_called()
+    mock_rollback_cls.assert_not_called()
+    kwargs = mock_workflow_cls.call_args.kwargs
+    assert kwargs['ci_orchestrator'] is None
+    assert kwargs['rollback_handler'] is None
+    assert kwargs['ci_smoke_tests'] == []
@@ -1,4 +1,6 @@
 """Tests for the CLI config commands."""
+import re
+
 import pytest
 from click.testing import CliRunner
 from unittest.mock import MagicMock, patch
@@ -51,6 +53,7 @@ def test_config_show(mock_config_manager):
     assert "https://api.example.com" in result.output
     assert "test_api...6789" in result.output
     assert "$10.00" in result.output
+    assert "model-p (abacus) • $0.0010/1k • max 1024 tokens" in result.output
 
 
 def test_config_show_with_secrets(mock_config_manager):
@@ -62,10 +65,31 @@ def test_config_show_with_secrets(mock_config_manager):
     assert "..." not in result.output
 
 
+def test_config_show_hides_short_keys(mock_config_manager):
+    """Keys too short to truncate meaningfully are not echoed back."""
+    mock_config_manager.get_config.return_value.abacus.api_key = "short"
+    runner = CliRunner()
+    result = runner.invoke(sologit_cli, ['config', 'show'])
+    assert result.exit_code == 0, result.output
+    assert "***" in result.output
+    assert "short" not in result.output
+
+
+@pytest.mark.parametrize(
+    ("api_key", "masked"),
+    [("abcdefghijkl", "***"), ("abcdefghijklm", "abcdefgh...jklm")],
+)
+def test_masked_key_never_reveals_whole_key(api_key, masked):
+    """A 12-character key would be fully shown by an 8+4 prefix/suffix, so it is hidden."""
+    assert AbacusAPIConfig(api_key=api_key).masked_key == masked
+
+
 def test_config_setup_interactive():
     """Test `config setup` in interactive mode."""
     runner = CliRunner()
-    with patch('sologit.cli.config_commands.ConfigManager') as mock_cm:
+    with patch('sologit.cli.config_commands.ConfigManager') as mock_cm, \
+         patch('sologit.cli.config_commands.sys') as mock_sys:
+        mock_sys.stdin.isatty.return_value = True
         mock_instance = mock_cm.return_value
         result = runner.invoke(sologit_cli, ['config', 'setup'], input="my_api_key\ny\n")
 
@@ -87,6 +111,75 @@ def test_config_setup_non_interactive():
         mock_instance.set_abacus_credentials.assert_called_with('key123', 'http://localhost')
 
 
+def test_config_setup_defaults_to_saved_endpoint():
+    """Omitting --endpoint keeps the endpoint already stored in the config."""
+    runner = CliRunner()
+    with patch('sologit.cli.config_commands.ConfigManager') as mock_cm:
+        mock_instance = mock_cm.return_value
+        mock_instance.get_config.return_value.abacus.endpoint = 'http://saved'
+        result = runner.invoke(sologit_cli, ['config', 'setup', '--no-interactive', '--api-key', 'key123'])
+
+        assert result.exit_code == 0, result.output
+        mock_instance.set_abacus_credentials.assert_called_with('key123', 'http://saved')
+
+
+def test_config_setup_takes_api_key_from_environment():
+    """ABACUS_API_KEY stands in for --api-key, so setup never prompts."""
+    runner = CliRunner()
+    with patch('sologit.cli.config_commands.ConfigManager') as mock_cm:
+        mock_instance = mock_cm.return_value
+        mock_instance.get_config.return_value.abacus.endpoint = 'http://saved'
+        result = runner.invoke(sologit_cli, ['config', 'setup'], env={'ABACUS_API_KEY': 'env_key'})
+
+        assert result.exit_code == 0, result.output
+        assert "Enter your Abacus.ai API key" not in result.output
+        mock_instance.set_abacus_credentials.assert_called_with('env_key', 'http://saved')
+
+
+def test_config_setup_reads_piped_payload():
+    """Non-interactive setup takes key=value credentials from piped stdin."""
+    runner = CliRunner()
+    with patch('sologit.cli.config_commands.ConfigManager') as mock_cm:
+        mock_instance = mock_cm.return_value
+        result = runner.invoke(
+            sologit_cli,
+            ['config', 'setup', '--no-interactive'],
+            input="# credentials\napi_key=piped_key\nendpoint=http://piped\n",
+        )
+
+        assert result.exit_code == 0, result.output
+        mock_instance.set_abacus_credentials.assert_called_with('piped_key', 'http://piped')
+
+
+def test_config_setup_reads_piped_payload_without_flag():
+    """Piped stdin is read as a payload even in the default interactive mode."""
+    runner = CliRunner()
+    with patch('sologit.cli.config_commands.ConfigManager') as mock_cm:
+        mock_instance = mock_cm.return_value
+        result = runner.invoke(sologit_cli, ['config', 'setup'], input="api_key=piped_key\n")
+
+        assert result.exit_code == 0, result.output
+        assert "Enter your Abacus.ai API key" not in result.output
+        mock_instance.set_abacus_credentials.assert_called_with('piped_key', 'https://api.abacus.ai/v1')
+
+
+def test_config_setup_never_prompts_on_piped_stdin():
+    """Interactive mode falls back to non-interactive when stdin is not a terminal."""
+    runner = CliRunner()
+    with patch('sologit.cli.config_commands.ConfigManager') as mock_cm, \
+         patch('sologit.cli.config_commands.click.prompt') as mock_prompt, \
+         patch('sologit.cli.config_commands.click.confirm') as mock_confirm:
+        mock_cm.return_value.has_abacus_credentials.return_value = True
+        result = runner.invoke(sologit_cli, ['config', 'setup'], input="my_api_key\ny\n")
+
+        assert result.exit_code != 0
+        assert "API key is required" in result.output
+        assert "Existing configuration detected" not in result.output
+        mock_prompt.assert_not_called()
+        mock_confirm.assert_not_called()
+        mock_cm.return_value.set_abacus_credentials.assert_not_called()
+
+
 def test_config_test_success():
     """Test `config test` with a valid configuration."""
     with patch('sologit.cli.config_commands.ConfigManager') as mock_cm_constructor:
@@ -96,11 +189,11 @@ def test_config_test_success():
         mock_config.abacus.is_configured.return_value = True
         mock_instance.get_config.return_value = mock_config
 
-        with patch('sologit.cli.config_commands.AbacusClient') as mock_abacus_client:
+        with patch('sologit.api.client.AbacusClient') as mock_abacus_client:
             mock_abacus_client.return_value.test_connection.return_value = True
 
             runner = CliRunner()
-            result = runner.invoke(sologit_cli, ['config', 'test'])
+            result = runner.invoke(sologit_cli, ['config', 'test', '--no-cache'])
 
             assert result.exit_code == 0
             assert "Configuration is valid" in result.output
@@ -122,9 +215,17 @@ def test_config_test_validation_fails():
         assert "Review the issues below" in result.output
         assert "Invalid model name" in result.output
 
+
+def _table_value(output, label):
+    """Return the value cell of the table row whose first column is ``label``."""
+    match = re.search(rf"^\s*{re.escape(label)}\s{{2,}}(\S.*?)\s*$", output, re.MULTILINE)
+    assert match, f"no table row for {label!r}"
+    return match.group(1)
+
+
 def test_config_budget_status(mock_config_manager):
     """Test `config budget status` command."""
-    with patch('sologit.cli.config_commands.CostGuard') as mock_cost_guard_constructor:
+    with patch('sologit.orchestration.cost_guard.CostGuard') as mock_cost_guard_constructor:
         mock_guard_instance = mock_cost_guard_constructor.return_value
         mock_guard_instance.get_status.return_value = {
             'daily_cap': 10.0,
@@ -134,12 +235,42 @@ def test_config_budget_status(mock_config_manager):
             'within_budget': True
         }
         runner = CliRunner()
-        result = runner.invoke(sologit_cli, ['config', 'budget', 'status'])
+        result = runner.invoke(sologit_cli, ['config', 'budget', 'status', '--no-cache'])
         assert result.exit_code == 0
         assert "Solo Git Budget Status" in result.output
-        assert "Used Today:     $2.50" in result.output
-        assert "Remaining:      $7.50" in result.output
-        assert "Usage:          25.0%" in result.output
+        assert _table_value(result.output, "Used Today") == "$2.50"
+        assert _table_value(result.output, "Remaining") == "$7.50"
+        assert _table_value(result.output, "Usage") == "25.0%"
+        assert "Budget status: Within budget" in result.output
+        assert result.output.count("$7.50") == 1
+
+
+def test_config_budget_status_renders_all_sections_once(mock_config_manager):
+    """Alerts, breakdown and last-usage sections share one console print."""
+    from sologit.cli import config_commands
+
+    with patch('sologit.orchestration.cost_guard.CostGuard') as mock_cost_guard_constructor, \
+            patch.object(config_commands.formatter.console, 'print',
+                         wraps=config_commands.formatter.console.print) as console_print:
+        mock_cost_guard_constructor.return_value.get_status.return_value = {
+            'daily_cap': 10.0,
+            'current_cost': 9.5,
+            'remaining': 0.5,
+            'percentage_used': 95.0,
+            'within_budget': True,
+            'alerts': [{'timestamp': '2025-01-01T00:00:00', 'level': 'warning', 'message': 'Near cap'}],
+            'usage_breakdown': {'total_tokens': 1200, 'calls_count': 3, 'by_model': {'gpt': 9.5}},
+            'last_usage': {'timestamp': 'now', 'model': 'gpt', 'cost_usd': 0.25, 'total_tokens': 400},
+        }
+        result = CliRunner().invoke(sologit_cli, ['config', 'budget', 'status', '--no-cache'])
+
+    assert result.exit_code == 0, result.output
+    for text in ("Budget alerts detected.", "Near cap", "1200 in 3 calls", "Most Recent Usage"):
+        assert text in result.output
+    assert _table_value(result.output, "Used Today") == "$9.50"
+    assert _table_value(result.output, "Usage") == "95.0%"
+    # The header is one print and every remaining section is a second one.
+    assert console_print.call_count == 2
 
 
 def test_config_init(isolated_cli_runner):
@@ -159,6 +290,46 @@ def test_config_init(isolated_cli_runner):
         assert "abacus:" in content
         assert "models:" in content
 
+
+def test_config_init_is_private_and_exclusive(isolated_cli_runner):
+    """`config init` writes a 0600 file and never clobbers one without --force."""
+    runner, temp_dir = isolated_cli_runner
+    config_file = temp_dir / 'config.yaml'
+
+    with patch.object(ConfigManager, 'DEFAULT_CONFIG_FILE', config_file):
+        result = runner.invoke(sologit_cli, ['config', 'init'])
+        assert result.exit_code == 0, result.output
+        assert config_file.stat().st_mode & 0o777 == 0o600
+
+        config_file.write_text("user edits")
+        result = runner.invoke(sologit_cli, ['config', 'init'])
+        assert result.exit_code == 0
+        assert "already exists" in result.output
+        assert config_file.read_text() == "user edits"
+        assert not list(temp_dir.glob('.*.tmp'))
+
+
+def test_write_text_atomic_sets_mode_and_cleans_up(tmp_path):
+    """Replacing writes land with the requested mode and leave no temp files behind."""
+    from sologit.cli.config_commands import _write_text_atomic
+
+    target = tmp_path / 'cache.json'
+    stale = tmp_path / 'cache.json.tmp'
+    stale.write_text("stale")
+    stale.chmod(0o644)
+
+    _write_text_atomic(target, "{}", mode=0o600)
+    _write_text_atomic(target, '{"a": 1}', mode=0o600)
+
+    assert target.read_text() == '{"a": 1}'
+    assert target.stat().st_mode & 0o777 == 0o600
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['cache.json', 'cache.json.tmp']
+
+    with pytest.raises(FileExistsError):
+        _write_text_atomic(target, "new", mode=0o600, exclusive=True)
+    assert target.read_text() == '{"a": 1}'
+
+
 def test_config_init_force(isolated_cli_runner):
     """Test `config init --force`."""
     runner, temp_dir = isolated_cli_runner
@@ -182,6 +353,8 @@ def test_config_path(isolated_cli_runner):
         result = runner.invoke(sologit_cli, ['config', 'path'])
         assert result.exit_code == 0
         assert str(expected_path) in result.output
+        # CliRunner output is not a terminal, so only the bare path is printed.
+        assert result.output == f"{expected_path}\n"
 
 def test_config_env_template(isolated_cli_runner):
     """Test `config env-template` command."""
@@ -193,3 +366,111 @@ def test_config_env_template(isolated_cli_runner):
     assert env_file.exists()
     content = env_file.read_text()
     assert "ABACUS_API_KEY" in content
+    assert not list(temp_dir.glob('.*.tmp'))
+
+
+def test_config_commands_defer_heavy_imports():
+    """Importing the config commands must not pull in the API client or orchestration stack."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, sologit.cli.config_commands as cc; "
+        "assert 'sologit.api.client' not in sys.modules; "
+        "assert 'sologit.orchestration' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_config_commands_define_each_function_once():
+    """Guard against the module being duplicated by a bad merge again."""
+    import ast
+    import collections
+    import inspect
+
+    from sologit.cli import config_commands
+
+    tree = ast.parse(Path(config_commands.__file__).read_text(encoding="utf-8"))
+    names = collections.Counter(
+        node.name for node in tree.body if isinstance(node, ast.FunctionDef)
+    )
+    assert [name for name, count in names.items() if count > 1] == []
+    assert config_commands.config_group.commands["env-template"].callback is config_commands.env_template.callback
+    # show renders the tiered model config, not the legacy *_model strings.
+    show_names = inspect.unwrap(config_commands.show_config.callback).__code__.co_names
+    assert "planning" in show_names
+    assert "planning_model" not in show_names
+
+
+def test_config_test_connection_timeout():
+    """A hung API probe is abandoned after --timeout seconds."""
+    import threading
+
+    release = threading.Event()
+    with patch('sologit.cli.config_commands.ConfigManager') as mock_cm_constructor:
+        mock_instance = mock_cm_constructor.return_value
+        mock_instance.validate.return_value = (True, [])
+        mock_instance.get_config.return_value = MagicMock()
+
+        with patch('sologit.api.client.AbacusClient') as mock_abacus_client:
+            mock_abacus_client.return_value.test_connection.side_effect = lambda: release.wait(5)
+
+            runner = CliRunner()
+            result = runner.invoke(sologit_cli, ['config', 'test', '--timeout', '1', '--no-cache'])
+            release.set()
+
+            assert result.exit_code != 0
+            assert "API connection timed out after 1s" in result.output
+
+
+def test_config_test_reuses_recent_successful_connection(monkeypatch, tmp_path):
+    """A successful probe is trusted for a minute unless --no-cache is given."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    probes = []
+
+    class FakeClient:
+        def __init__(self, config):
+            self.config = config
+
+        def test_connection(self):
+            probes.append(self.config.endpoint)
+            return True
+
+    with patch('sologit.cli.config_commands.ConfigManager') as mock_cm_constructor, \
+            patch('sologit.api.client.AbacusClient', FakeClient):
+        mock_instance = mock_cm_constructor.return_value
+        mock_instance.validate.return_value = (True, [])
+        mock_instance.get_config.return_value = SoloGitConfig(
+            abacus=AbacusAPIConfig(endpoint="https://api.example.com", api_key="test_api_key_123456789"),
+        )
+
+        runner = CliRunner()
+        assert runner.invoke(sologit_cli, ['config', 'test']).exit_code == 0
+        cached = runner.invoke(sologit_cli, ['config', 'test'])
+        assert cached.exit_code == 0
+        assert "API connection successful (cached)" in cached.output
+        assert len(probes) == 1
+
+        assert runner.invoke(sologit_cli, ['config', 'test', '--no-cache']).exit_code == 0
+        assert len(probes) == 2
+
+    cache_file = tmp_path / '.sologit' / 'cli_connection_ok.json'
+    assert cache_file.stat().st_mode & 0o777 == 0o600
+    assert "test_api_key_123456789" not in cache_file.read_text()
+
+
+def test_config_test_rejects_non_http_endpoint():
+    """A malformed endpoint fails before any client is built."""
+    with patch('sologit.cli.config_commands.ConfigManager') as mock_cm_constructor:
+        mock_instance = mock_cm_constructor.return_value
+        mock_instance.validate.return_value = (True, [])
+        mock_instance.get_config.return_value = SoloGitConfig(
+            abacus=AbacusAPIConfig(endpoint="api.example.com", api_key="test_api_key_123456789"),
+        )
+
+        with patch('sologit.api.client.AbacusClient') as mock_abacus_client:
+            result = CliRunner().invoke(sologit_cli, ['config', 'test', '--no-cache'])
+
+        assert result.exit_code != 0
+        assert "Invalid endpoint URL" in result.output
+        mock_abacus_client.assert_not_called()
@@ -200,3 +200,58 @@ def test_main_uses_interactive_shell(cli_main, monkeypatch):
     assert called["shell"] == 0
     assert "cmd" not in called
     assert exit_codes == [0]
+
+
+def test_run_batch_session_dispatches_each_line(cli_main, monkeypatch):
+    import io
+
+    calls = []
+
+    def fake_execute(args, **kwargs):
+        calls.append(args)
+        if args[0] == "boom":
+            raise click.Abort()
+        return 0
+
+    warnings = []
+    monkeypatch.setattr(cli_main, "_execute_cli_command", fake_execute)
+    monkeypatch.setattr(cli_main.formatter, "print_warning", warnings.append)
+
+    stream = io.StringIO(
+        "# comment\n"
+        "\n"
+        "pad create 'first pad'\n"
+        "repl\n"
+        "boom\n"
+        "hello\n"
+        "exit\n"
+        "hello\n"
+    )
+
+    exit_code = cli_main._run_batch_session(stream)
+
+    assert exit_code == 1
+    assert calls == [["pad", "create", "first pad"], ["boom"], ["hello"]]
+    assert len(warnings) == 2
+
+
+def test_repl_command_succeeds_for_clean_batch(cli_main, monkeypatch):
+    from click.testing import CliRunner
+
+    monkeypatch.setattr(cli_main, "_execute_cli_command", lambda args, **kwargs: 0)
+
+    result = CliRunner().invoke(cli_main.cli, ["repl"], input="hello\nversion\n")
+
+    assert result.exit_code == 0, result.output
+
+
+def test_repl_command_returns_batch_exit_code(cli_main, monkeypatch):
+    from click.testing import CliRunner
+
+    monkeypatch.setattr(cli_main, "_execute_cli_command", lambda args, **kwargs: 2)
+    monkeypatch.setattr(cli_main.formatter, "print_warning", lambda message: None)
+
+    result = CliRunner().invoke(cli_main.cli, ["repl"], input="hello\n")
+
+    assert result.exit_code == 1
+    assert "Aborted!" not in result.output
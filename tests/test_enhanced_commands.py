@@ -0,0 +1,119 @@
+"""Tests for the Rich-enhanced CLI helpers."""
+
+from types import SimpleNamespace
+
+import git
+import pytest
+
+from sologit.state.manager import StateManager
+
+
+@pytest.fixture
+def enhanced(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    from sologit.cli.enhanced_commands import EnhancedCLI
+
+    cli = EnhancedCLI()
+    cli.state_manager = StateManager(state_dir=tmp_path / "state")
+    return cli
+
+
+@pytest.fixture
+def history_repo(tmp_path):
+    repo_path = tmp_path / "repo"
+    repo = git.Repo.init(repo_path)
+    actor = git.Actor("Dev", "dev@example.com")
+    for index in range(3):
+        (repo_path / "file.txt").write_text(f"v{index}\n")
+        repo.index.add(["file.txt"])
+        repo.index.commit(f"commit {index}\n\nbody {index}", author=actor, committer=actor)
+    return SimpleNamespace(id="repo-1", path=repo_path), repo
+
+
+def test_load_initial_commit_history_records_recent_commits(enhanced, history_repo):
+    repo, git_repo = history_repo
+
+    enhanced._load_initial_commit_history(repo.id, repo.path, limit=2)
+
+    commits = enhanced.state_manager.get_commits(repo.id)
+    assert len(commits) == 2
+    head = git_repo.head.commit
+    by_sha = {commit.sha: commit for commit in commits}
+    assert head.hexsha in by_sha
+    node = by_sha[head.hexsha]
+    assert node.short_sha == head.hexsha[:8]
+    assert node.author == "Dev"
+    assert node.message.startswith("commit 2\n\nbody 2")
+    assert node.parent_sha == head.parents[0].hexsha
+    assert node.is_trunk
+
+
+def test_load_initial_commit_history_stores_newest_first(enhanced, history_repo):
+    repo, git_repo = history_repo
+
+    enhanced._load_initial_commit_history(repo.id, repo.path)
+
+    stored = [commit.sha for commit in enhanced.state_manager.get_commits(repo.id)]
+    assert stored == [commit.hexsha for commit in git_repo.iter_commits()]
+
+
+def test_graph_renderer_is_built_once_on_the_cli_console(enhanced):
+    renderer = enhanced.graph_renderer
+
+    assert renderer is enhanced.graph_renderer
+    assert renderer.console is enhanced.formatter.console
+
+
+def test_repo_info_loads_history_on_first_view(enhanced, history_repo):
+    repo, git_repo = history_repo
+    enhanced.state_manager.create_repository(repo.id, "demo", str(repo.path))
+    assert enhanced.state_manager.get_commits(repo.id) == []
+
+    enhanced.repo_info(repo.id)
+
+    assert len(enhanced.state_manager.get_commits(repo.id)) == 3
+
+
+def test_pad_list_builds_each_status_cell_once(enhanced, monkeypatch, tmp_path):
+    enhanced.state_manager.create_repository("repo-1", "demo", str(tmp_path))
+    for index in range(3):
+        enhanced.state_manager.create_workpad(
+            f"pad-{index}", "repo-1", f"pad {index}", f"pads/pad-{index}", "abc123"
+        )
+
+    theme = enhanced.formatter.theme_obj
+    calls = []
+    original = type(theme).get_status_icon
+    monkeypatch.setattr(type(theme), "get_status_icon",
+                        lambda self, status: calls.append(status) or original(self, status))
+
+    enhanced.pad_list("repo-1")
+    enhanced.pad_list("repo-1")
+
+    assert calls == ["active"]
+
+
+def test_importing_module_builds_no_cli():
+    from sologit.cli import enhanced_commands
+
+    assert not hasattr(enhanced_commands, "enhanced_cli")
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"git_url": "   "}, "Provide either zip_file or git_url"),
+        ({"zip_file": "missing.zip"}, "Zip file not found"),
+    ],
+)
+def test_repo_init_rejects_bad_arguments_before_output(enhanced, monkeypatch, kwargs, message):
+    import click
+
+    headers = []
+    monkeypatch.setattr(enhanced.formatter, "print_header", headers.append)
+
+    with pytest.raises(click.BadParameter, match=message):
+        enhanced.repo_init(**kwargs)
+
+    assert headers == []
+    assert enhanced._git_engine is None
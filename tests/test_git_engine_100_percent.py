@@ -343,14 +343,13 @@ index 0000000..ce01362
         repo_id = git_engine.init_from_zip(simple_repo_zip, "test-repo")
         pad_id = git_engine.create_workpad(repo_id, "test-pad")
         
-        # Mock iter_commits to raise an exception
-        from git import Repo as GitRepo
-        original_iter_commits = GitRepo.iter_commits
+        # Mock rev-list to raise an exception
+        from git.cmd import Git
         
-        def mock_iter_commits(self, *args, **kwargs):
-            raise Exception("Failed to get commits")
+        def mock_rev_list(self, *args, **kwargs):
+            raise GitCommandError('rev-list', 'fatal: bad revision')
         
-        monkeypatch.setattr(GitRepo, "iter_commits", mock_iter_commits)
+        monkeypatch.setattr(Git, "rev_list", mock_rev_list, raising=False)
         
         with pytest.raises(GitEngineError) as exc_info:
             git_engine.get_commits_ahead_behind(pad_id)
@@ -266,7 +266,7 @@ def test_get_workpad_stats(git_engine, repo_with_workpad):
     
     assert stats['pad_id'] == pad_id
     assert 'files_changed' in stats
-    assert 'commits_ahead' in stats
+    assert stats['commits_ahead'] == 1
     assert 'checkpoints' in stats
     assert stats['checkpoints'] == 1
     assert stats['status'] == 'active'
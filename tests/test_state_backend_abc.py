@@ -1,6 +1,7 @@
 """Tests for the StateBackend abstract base class implementation."""
 
 import inspect
+import sys
 from pathlib import Path
 
 import pytest
@@ -24,3 +25,52 @@ def test_json_state_backend_implements_contract(tmp_path: Path) -> None:
     backend.write_global_state(backend.read_global_state())
     assert backend.list_repositories() == []
     assert backend.list_workpads() == []
+
+
+def test_write_commits_keeps_newest_first_in_one_write(tmp_path: Path, monkeypatch) -> None:
+    """Bulk commit writes match repeated write_commit ordering with a single file write."""
+    from sologit.state.schema import CommitNode
+
+    backend = JSONStateBackend(tmp_path)
+    backend.write_commit("repo", CommitNode(sha="old", short_sha="old", message="", author="", timestamp=""))
+
+    writes = []
+    original = backend._write_json
+    monkeypatch.setattr(backend, "_write_json", lambda path, data: (writes.append(path), original(path, data)))
+
+    backend.write_commits("repo", [
+        CommitNode(sha=sha, short_sha=sha, message="", author="", timestamp="") for sha in ("new", "mid")
+    ])
+
+    assert [commit.sha for commit in backend.read_commits("repo")] == ["new", "mid", "old"]
+    assert len(writes) == 1
+
+
+def test_list_workpads_filters_by_status(tmp_path: Path) -> None:
+    """Workpads outside ``status_in`` are skipped before being deserialised."""
+    from sologit.state.manager import StateManager
+
+    manager = StateManager(state_dir=tmp_path)
+    for workpad_id, status in (("a", "active"), ("b", "promoted"), ("c", "testing")):
+        manager.create_workpad(workpad_id, "repo", workpad_id, f"pads/{workpad_id}", "base")
+        manager.update_workpad(workpad_id, status=status)
+    manager.create_workpad("d", "other", "d", "pads/d", "base")
+
+    active = manager.list_workpads("repo", status_in=("active", "testing"))
+
+    assert sorted(w.workpad_id for w in active) == ["a", "c"]
+    assert len(manager.list_workpads("repo")) == 3
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+def test_bulk_state_records_use_slots_and_round_trip() -> None:
+    """Listed state records carry no per-instance __dict__ and still serialise."""
+    from sologit.state.schema import CommitNode, WorkpadState
+
+    node = CommitNode(sha="abc", short_sha="abc", message="m", author="a", timestamp="t")
+    assert not hasattr(node, "__dict__")
+    assert CommitNode.from_dict(node.to_dict()) == node
+
+    workpad = WorkpadState(workpad_id="w", repo_id="r", title="t", branch_name="b", base_commit="c", status="active")
+    assert not hasattr(workpad, "__dict__")
+    assert WorkpadState.from_dict(workpad.to_dict()) == workpad
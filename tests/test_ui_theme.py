@@ -0,0 +1,26 @@
+"""Tests for the Heaven Interface theme status lookups."""
+
+import pytest
+
+from sologit.ui.theme import HeavenTheme
+
+
+@pytest.mark.parametrize(
+    ("status", "color_field", "icon_field"),
+    [
+        ("passed", "passed", "success"),
+        ("OK", "passed", "success"),
+        ("error", "failed", "error"),
+        ("queued", "pending", "pending"),
+        ("yellow", "pending", "info"),
+        ("Active", "running", "running"),
+        ("blue", "running", "info"),
+        ("warn", "text_secondary", "warning"),
+        ("unknown", "text_secondary", "info"),
+    ],
+)
+def test_status_lookups_map_case_insensitively(status, color_field, icon_field):
+    theme = HeavenTheme()
+
+    assert theme.get_status_color(status) == getattr(theme.colors, color_field)
+    assert theme.get_status_icon(status) == getattr(theme.icons, icon_field)